@@ -0,0 +1,125 @@
+"""Benchmark of the startup time of simtex, each command is run in a new
+interpreter, as it is from the shell.
+
+Usage:
+    python benchmarks/startup.py [--runs N] [--save] [--check]
+
+--save records the medians in benchmarks/startup.json, and --check fails
+if any median is slower than the recorded one by more than TOLERANCE.
+"""
+
+from argparse import ArgumentParser
+from json import dump, load
+from os.path import dirname, exists, join
+from statistics import median
+from subprocess import DEVNULL, run
+from sys import executable
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import IO, Any
+
+ROOT: str = dirname(dirname(__file__)) or "."
+BASELINE: str = join(ROOT, "benchmarks", "startup.json")
+
+# how much slower than the baseline a median can be before --check fails.
+TOLERANCE: float = 1.5
+
+
+def _time(cmd: list[str]) -> float:
+    """Run the command once.
+
+    Args:
+        cmd -- the command.
+
+    Returns:
+        The wall time of the command, in milliseconds.
+    """
+
+    start: float = perf_counter()
+    run(cmd, cwd=ROOT, stdout=DEVNULL, stderr=DEVNULL, check=True)
+
+    return (perf_counter() - start)*1000
+
+
+def benchmark(runs: int) -> dict[str, float]:
+    """Time the commands.
+
+    Args:
+        runs -- the number of runs of each command.
+
+    Returns:
+        The median wall time of each command, in milliseconds.
+    """
+
+    results: dict[str, float] = {
+            "version": median(
+                    _time([executable, "-m", "src.main", "--version"])
+                    for _ in range(runs)
+                )
+        }
+
+    times: list[float] = []
+    for _ in range(runs):
+        # a new output folder every run, so that the manifest does not
+        # skip the conversion.
+        out: str
+        with TemporaryDirectory() as out:
+            times.append(
+                _time(
+                    [
+                        executable, "-m", "src.main",
+                        "examples/example.md",
+                        "-y", "-o", out, "-t", "T", "-d", "D"
+                    ]
+                )
+            )
+    results["convert"] = median(times)
+
+    return results
+
+
+def main() -> None:
+    """Run the benchmark, and compare it with the baseline."""
+
+    parser: ArgumentParser = ArgumentParser(
+            description="Benchmark the startup time of simtex."
+        )
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--save", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    args: Any = parser.parse_args()
+
+    results: dict[str, float] = benchmark(args.runs)
+
+    baseline: dict[str, float] = {}
+    if exists(BASELINE):
+        base_file: IO[Any]
+        with open(BASELINE, "r", encoding="utf-8") as base_file:
+            baseline = load(base_file)
+
+    slower: list[str] = []
+
+    name: str; took: float
+    for name, took in results.items():
+        line: str = f"{name:<10}{took:8.1f} ms"
+        if name in baseline:
+            line += f"  (baseline {baseline[name]:.1f} ms)"
+            if took > baseline[name]*TOLERANCE:
+                slower.append(name)
+        print(line)
+
+    if args.save:
+        with open(BASELINE, "w", encoding="utf-8") as base_file:
+            dump(
+                {name: round(took, 1) for name, took in results.items()},
+                base_file,
+                indent=4
+            )
+
+    if args.check and slower:
+        print(f"Slower than the baseline: {', '.join(slower)}.")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
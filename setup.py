@@ -46,8 +46,7 @@ setup(
     py_modules=find_module("src"),
     python_requires=">=3.10",
     install_requires=[
-            "rich==12.4.4",
-            "requests==2.28.1"
+            "rich==12.4.4"
         ],
     classifiers=[
             "Development Status :: 4 - Beta",
@@ -0,0 +1,163 @@
+from dataclasses import dataclass, replace
+from datetime import datetime
+from io import BytesIO
+from typing import Iterable, Optional
+
+from src.configs.config import Config
+from src.configs.rules import Rules
+from src.configs.replacements import Replacements
+from src.mutils.longtable_rows import longtable_rows
+from src.mutils.tex_writer import TexWriter
+from src.utils.logger import Logger
+from src.utils.tex.parser.body import body
+from src.utils.tex.parser.headings import headings, preamble
+
+
+class ConversionError(Exception):
+    """Raised when a document cannot be converted, with the errors that
+    were logged while converting it."""
+
+
+@dataclass(frozen=True)
+class Document:
+    """Dataclass of a converted document.
+
+    Params:
+        latex -- the LaTeX source of the document.
+        assets -- the files that the document references, e.g. the images,
+            as they are written in the markdown.
+    """
+
+    latex: str
+    assets: list[str]
+
+
+def _convert(
+        log: Logger,
+        text: str,
+        title: str,
+        config: Config,
+        rules: Rules,
+        replacements: Replacements,
+        rendered: str
+    ) -> Document:
+    """Convert a document, with the preamble already rendered.
+
+    Args:
+        log -- for logging.
+        text -- the markdown.
+        title -- title of the document.
+        config, rules, replacements -- see convert_text.
+        rendered -- the preamble of the config.
+
+    Returns:
+        The converted document.
+    """
+
+    # the errors of the documents converted before are not reported.
+    first: int = len(log.errors)
+
+    buffer: BytesIO = BytesIO()
+
+    out_file: TexWriter
+    with TexWriter(buffer) as out_file:
+        try:
+            headings(
+                log, config, title.replace("_", r"\_"), out_file, rendered
+            )
+            out_file.begin_document(config.make_title)
+            assets: list[str] = body(
+                    log,
+                    rules,
+                    replacements,
+                    config.replace,
+                    text.splitlines(keepends=True),
+                    out_file,
+                    long_rows=longtable_rows(config)
+                )
+            out_file.end_document()
+            out_file.flush()
+        except SystemExit as Err: # already logged
+            raise ConversionError("; ".join(log.errors[first:])) from Err
+
+        # read before the writer closes the buffer.
+        latex: str = buffer.getvalue().decode("utf-8")
+
+    return Document(latex, assets)
+
+
+def convert_texts(
+        texts: Iterable[str | tuple[str, str]],
+        config: Config,
+        rules: Rules,
+        replacements: Replacements,
+        log: Optional[Logger] = None
+    ) -> list[Document]:
+    """Convert many markdown documents to LaTeX, which share the compiled
+    rules and the preamble.
+
+    Args:
+        texts -- the markdown of each document, or its title and markdown.
+        config -- configuration of the document metadata, which includes,
+            formatting, packages to use among others, refer to simtex.json,
+            it is not modified.
+        rules -- rules that needs to be followed in translation.
+        replacements -- math symbols that will be replaced with latex commands.
+        log -- for logging, nothing is logged if None.
+
+    Returns:
+        The converted documents, in the same order.
+
+    Raises:
+        ConversionError -- if any of the documents cannot be converted.
+    """
+
+    log_: Logger = log if log is not None else Logger(silent=True)
+
+    if config.date == "<NOW>":
+        config = replace(config, date=datetime.now().strftime("%B %d, %Y"))
+
+    rendered: str = preamble(log_, config)
+
+    documents: list[Document] = []
+
+    text: str | tuple[str, str]
+    for text in texts:
+        title: str = ""
+        if isinstance(text, tuple):
+            title, text = text
+
+        documents.append(
+            _convert(
+                log_, text, title, config, rules, replacements, rendered
+            )
+        )
+
+    return documents
+
+
+def convert_text(
+        text: str,
+        config: Config,
+        rules: Rules,
+        replacements: Replacements,
+        title: str = "",
+        log: Optional[Logger] = None
+    ) -> Document:
+    """Convert a markdown document to LaTeX.
+
+    Args:
+        text -- the markdown.
+        config, rules, replacements, log -- see convert_texts.
+        title -- title of the document.
+
+    Returns:
+        The converted document.
+
+    Raises:
+        ConversionError -- if the document cannot be converted.
+    """
+
+    return convert_texts(
+            [(title, text)], config, rules, replacements, log
+        )[0]
@@ -1,21 +1,38 @@
 from argparse import ArgumentParser
+from os.path import abspath, isdir
 from subprocess import CalledProcessError
-from typing import Callable
+from typing import Optional
 
+from src.configs.config import Config
+from src.configs.profiles import PROFILES
+from src.configs.replacements import Replacements
+from src.configs.rules import Rules
 from src.utils.config_fetch import ConfParse
-from src.utils.convert import convert
+from src.mutils.find_files import find_files
 from src.mutils.update_conf import update_conf
 from src.metadata.info import PkgInfo
 from src.utils.logger import Logger
 
+# the modules of the conversion, the watch mode and the server are
+# imported by the paths that use them, so that --help and --version do
+# not pay for them.
+
+# how long the inputs need to stay unchanged before they are converted
+# again, in seconds.
+DEBOUNCE: float = 0.3
+
 
 class Cli:
     """Commandline interface of the program."""
 
-    def __init__(self) -> None:
-        self.log: Logger = Logger()
-        self.conf_parse: ConfParse = ConfParse(self.log)
+    config: Config
+    rules: Rules
+    replacement: Replacements
+
+    log: Logger
+    conf_parse: ConfParse
 
+    def __init__(self) -> None:
         self.parser: ArgumentParser = ArgumentParser(
                 prog="simtex",
                 usage="simtex [INPUT] [ARGUMENTS]",
@@ -28,6 +45,7 @@ class Cli:
         self.parser.add_argument(
             "input", metavar="[INPUT]",
             type=str,
+            nargs="?",
             help="File to convert to LaTeX."
         )
         self.parser.add_argument(
@@ -40,6 +58,11 @@ class Cli:
             help="Build the generated LaTeX file and view the output.",
             action="store_true"
         )
+        self.parser.add_argument(
+            "-w", "--watch",
+            help="Convert and build the input again whenever it changes.",
+            action="store_true"
+        )
 
     def _arguments(self) -> None:
         """Main and commonly used arguments of the program"""
@@ -74,6 +97,12 @@ class Cli:
             help="Use a different LaTeX compiler.",
             action="store"
         )
+        self.parser.add_argument(
+            "-P", "--profile",
+            help="Build profile to be used.",
+            action="store",
+            choices=PROFILES
+        )
 
     def _doc_args(self) -> None:
         """For modification of document properties."""
@@ -132,17 +161,139 @@ class Cli:
             help="Automatically replace math symbols defined.",
             action="store_true"
         )
+        self.parser.add_argument(
+            "-j", "--jobs",
+            help="Number of files to convert and build in parallel.",
+            action="store",
+            type=int,
+            default=1
+        )
+        self.parser.add_argument(
+            "-q", "--quiet",
+            help="Print only a summary of the conversion, and its errors.",
+            action="store_true"
+        )
         self.parser.add_argument(
             "-v", "--verbose",
             help="Show the stdout of processes.",
             action="store_true"
         )
+        self.parser.add_argument(
+            "--serve",
+            help="Serve the conversions of the clients, until interrupted.",
+            action="store_true"
+        )
         self.parser.add_argument(
             "--version",
             help="Print the version number of the application.",
             action="store_true"
         )
 
+    def _inputs(self) -> list[str]:
+        """Find the inputs, i.e. the input file or the files in the input
+        directory.
+
+        Returns:
+            The paths of the inputs.
+        """
+
+        return (
+                find_files(self.args.input, self.rules.compiled.files)
+                if isdir(self.args.input) else [self.args.input]
+            )
+
+    def _watch(self) -> Optional[list[str]]:
+        """Convert and build the inputs, and then the ones that changed,
+        until interrupted.
+
+        The config is kept in memory, and read again only if simtex.json
+        or the config of the code blocks changed. A conversion that fails
+        is reported, and the inputs are watched nonetheless.
+
+        Returns:
+            The path(s) of the files of the last conversion that did not
+            fail, None if none did.
+        """
+
+        from src.mutils.watcher import Watcher
+        from src.utils.convert import convert
+
+        conf_files: list[str] = [
+                f"{self.conf_parse.CONF_PATH}/simtex.json",
+                self.config.code_conf
+            ]
+        watcher: Watcher = Watcher(self.log, [self.args.input, *conf_files])
+        state: dict[str, tuple[int, int]] = watcher.snapshot()
+
+        files: Optional[list[str]] = None
+        inputs: Optional[list[str]] = None # every input, at first
+        reload: bool = False
+
+        self.log.logger(
+            "I",
+            f"Watching {self.args.input} for changes, press Ctrl+C to stop ..."
+        )
+
+        try:
+            while True:
+                try:
+                    if reload:
+                        self.log.logger(
+                            "I", "The config changed, reloading it ..."
+                        )
+                        self.config, self.rules, self.replacement = (
+                                self.conf_parse.fetched_conf(
+                                        self.args.assumeyes
+                                    )
+                            )
+                        update_conf(
+                            self.log,
+                            self.config,
+                            self.args,
+                            self.args.assumeyes
+                        )
+                        reload = False
+
+                    files = convert(
+                            self.log,
+                            self.args,
+                            self.rules,
+                            self.config,
+                            self.replacement,
+                            inputs
+                        )
+                except SystemExit: # already logged
+                    self.log.logger("I", "Waiting for changes ...")
+
+                self.args.buildnview = False # the viewer reloads the pdf
+
+                while True:
+                    watcher.wait(DEBOUNCE)
+
+                    current: dict[str, tuple[int, int]] = watcher.snapshot()
+                    changed: set[str] = {
+                            file for file, stamp in current.items()
+                            if state.get(file) != stamp
+                        }
+                    state = current
+
+                    reload = reload or any(
+                            abspath(file) in changed for file in conf_files
+                        )
+                    # every input depends on the config
+                    inputs = None if reload else [
+                            file for file in self._inputs()
+                            if abspath(file) in changed
+                        ]
+                    if inputs != []:
+                        break
+        except KeyboardInterrupt:
+            self.log.logger("I", "Stopped watching.")
+        finally:
+            watcher.close()
+
+        return files
+
     def create_parser(self) -> None:
         """Create the parser."""
 
@@ -157,8 +308,38 @@ class Cli:
         """Commandline interface of the program."""
         self.create_parser() # create the arguments
 
+        if self.args.version and not (
+                self.args.input or self.args.build or self.args.buildnview
+            ):
+            print(f"Simtex version: {PkgInfo.__version__}.")
+            raise SystemExit
+
+        if self.args.input is None and (
+                self.args.build or self.args.buildnview or self.args.watch
+            ):
+            self.parser.error("the input file or directory is required")
+
+        # created only after the arguments are parsed, since the logger
+        # and the checks of the config are slow to start.
+        self.log = Logger(self.args.quiet)
+        self.conf_parse = ConfParse(self.log)
+
+        files: Optional[list[str]] = None
         try:
-            if self.args.input or self.args.build or self.args.buildnview:
+            if self.args.serve:
+                from src.utils.server import serve
+
+                serve(
+                    self.log,
+                    self.parser,
+                    self.conf_parse,
+                    self.conf_parse.fetched_conf(self.args.assumeyes)
+                )
+                raise SystemExit
+
+            elif self.args.input or self.args.build or self.args.buildnview:
+                from src.utils.convert import convert
+
                 self.config, self.rules, self.replacement = (
                         self.conf_parse.fetched_conf(
                                 self.args.assumeyes
@@ -170,22 +351,20 @@ class Cli:
                     self.log, self.config, self.args, self.args.assumeyes
                 )
 
-                converter: Callable[[], list[str]] = lambda: convert(
-                        self.log,
-                        self.args,
-                        self.rules,
-                        self.config,
-                        self.replacement
-                    )
-
-                files: list[str] = converter()
-
-            elif self.args.version:
-                print(f"Simtex version: {PkgInfo.__version__}.")
-                raise SystemExit
+                if self.args.watch:
+                    files = self._watch()
+                else:
+                    files = convert(
+                            self.log,
+                            self.args,
+                            self.rules,
+                            self.config,
+                            self.replacement
+                        )
 
             else:
                 self.log.logger("E", "Unknown option.")
+                raise SystemExit
 
         except KeyboardInterrupt:
             self.log.logger("E", "Operation interrupted, aborting ...")
@@ -194,7 +373,12 @@ class Cli:
                 "E", f"CalledProcessError: {Err}, aborting ..."
             )
         else:
-            print(
-                f"\033[34mINFO\033[0m\t File(s) {self.args.input} converted "
-                f"successfully and can be found in \033[1;36m{files}\033[0m."
-            )
+            if not self.args.quiet:
+                print(
+                    f"\033[34mINFO\033[0m\t File(s) {self.args.input} "
+                    "converted successfully and can be found in "
+                    f"\033[1;36m{files}\033[0m."
+                )
+        finally:
+            if self.args.quiet:
+                self.log.summary(len(files) if files is not None else None)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from os.path import expanduser
 
 
 @dataclass
@@ -39,6 +40,16 @@ class Config:
         collinec -- column line end count -- the number of column border
             that will be included.
         thead_for -- formatting of the table headings.
+        cache_dir -- where the precompiled and built files are cached.
+        cache_size -- the maximum size of the cache of the builds, in
+            MB, 0 to disable it.
+        max_passes -- the maximum number of times the compiler is run on
+            a file, until its references are resolved.
+        profile -- the build profile, i.e. draft, fast or final.
+        block_cache_size -- the maximum size of the cache of the converted
+            blocks, in MB, 0 to disable it.
+        longtable_rows -- the number of rows after which a table is
+            written as a longtable, 0 to never use it.
     """
 
     doc_class: str
@@ -65,3 +76,9 @@ class Config:
     replace: bool
     twocols: bool
     assume_yes: bool
+    cache_dir: str = f"{expanduser('~')}/.cache/simtex"
+    cache_size: int = 1024
+    max_passes: int = 3
+    profile: str = "final"
+    block_cache_size: int = 64
+    longtable_rows: int = 100
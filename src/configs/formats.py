@@ -0,0 +1,7 @@
+# the preamble of the generated files ends with this line, everything
+# before it is dumped into a format with mylatexformat, which skips the
+# preamble of the document up to this line when it is loaded.
+ENDOFDUMP: str = r"\csname endofdump\endcsname"
+
+# the compilers that can load a format dumped with mylatexformat.
+FORMAT_COMPILERS: tuple[str, ...] = ("pdflatex", "xelatex")
@@ -0,0 +1,175 @@
+"""The default config files, which are written into the config folder
+when they are missing, and merged into simtex.json when it is missing
+parameters.
+
+Generated from examples/config/simtex.json and examples/config/code_conf.txt,
+which are the files that the users see, keep them in sync.
+"""
+
+SIMTEX_JSON: str = r"""[
+    {
+        "FOR": [
+            "md"
+        ],
+        "CODE_BLOCKS": "```",
+        "IMAGE": "!\\[([^]]+)\\]\\(([^]]+)\\)",
+        "LINKS": "\\[([^]]+)\\]\\(([^]]+)\\)",
+        "SECTION": "#",
+        "SUBSECTION": "##",
+        "SUBSUBSECTION": "###",
+        "PARAGRAPH": "####",
+        "SUBPARAGRAPH": "#####",
+        "PARAGRAPH_MATH": "$$",
+        "INLINE_MATH": ["$", "\\$(.*?)\\$"],
+        "INLINE_CODE": [
+            "`",
+            "`(.*?)`"
+        ],
+        "BOLD": [
+            "**",
+            "\\*\\*(.*?)\\*\\*"
+        ],
+        "ITALICS": [
+            "__",
+            "__(.*?)__"
+        ],
+        "EMPH": [
+            "!*",
+            "!\\*(.*?)!\\*"
+        ],
+        "STRIKE": [
+            "~~",
+            "~~(.*?)~~"
+        ],
+        "SUPSCRIPT": [
+            "^^",
+            "\\^\\^(.*?)\\^\\^"
+        ],
+        "SUBSCRIPT": [
+            "-^",
+            "-\\^(.*?)-\\^"
+        ],
+        "ULINE": [
+            "._",
+            "._(.*?)._"
+        ],
+        "QUOTE": [
+            "\"",
+            "\"(.*?)\""
+        ],
+        "BQUOTE": ">",
+        "NONUM": "*"
+    },
+    {
+        "DOC_CLASS": "article",
+        "DEF_FONT": "lmodern",
+        "FONT_SIZE": 12,
+        "MARGIN": 1,
+        "PAPER_SIZE": "a4paper",
+        "INDENT_SIZE": 24,
+        "SLOPPY": true,
+        "CODE_FONT": "DejaVuSansMono",
+        "CFONT_SCALE": 0.9,
+        "CODE_CONF": "<HOME>/.config/simtex/code_conf.txt",
+        "PACKAGES": [
+            ["geometry", "margin=<MARGIN>, <PAPER_SIZE>"],
+            "indentfirst",
+            "amsmath",
+            "mathtools",
+            "sectsty",
+            "footmisc",
+            "gensymb",
+            "xcolor",
+            "listings",
+            "caption",
+            "longtable",
+            "csquotes",
+            ["ulem", "normalem"],
+            ["hyperref", "colorlinks, allcolors=<LINK_COLORS>"]
+        ],
+        "FOOTNOTE": "footnote",
+        "SECTION_SIZES": {
+            "main": "<DEF>",
+            "sub": "<DEF>",
+            "subsub": "<DEF>"
+        },
+        "LINKS": true,
+        "LINK_COLOR": "blue",
+        "AUTHOR": "John Doe",
+        "DATE": "<NOW>",
+        "MAKE_TITLE": true,
+        "OUTPUT_FOLDER": "out",
+        "COMPILER": "pdflatex",
+        "ENCODE": "UTF8",
+        "REPLACE": false,
+        "TWOCOLS": false,
+        "ASSUME_YES": false,
+        "CACHE_DIR": "<HOME>/.cache/simtex",
+        "CACHE_SIZE": 1024,
+        "MAX_PASSES": 3,
+        "PROFILE": "final",
+        "BLOCK_CACHE_SIZE": 64,
+        "LONGTABLE_ROWS": 100
+    },
+    {
+        "-->": "\\longrightarrow",
+        "<--": "\\longleftarrow",
+        "===": "\\equiv",
+        "~==": "\\approxeq",
+        "<<": "\\ll",
+        "<=": "\\leq",
+        ">=": "\\geq",
+        ".=": "\\doteq",
+        "~~": "\\approx",
+        "~=": "\\simeq",
+        "~~=": "\\cong",
+        ">>": "\\gg",
+        "+-": "\\pm",
+        "./.": "\\div",
+        "-+": "\\mp",
+        "|>": "\\triangleleft",
+        "<|": "\\triangleright",
+        "<-": "\\leftarrow",
+        "->": "\\rightarrow",
+        "<->": "\\leftrightarrow",
+        "<==": "\\Leftarrow",
+        "==>": "\\Rightarrow",
+        "<=>": "\\Leftrightarrow",
+        "|->": "\\mapsto",
+        "===>": "\\Longrightarrow",
+        "<===": "\\Longleftarrow",
+        "<===>": "\\Longleftrightarrow",
+        "~~>": "\\leadsto",
+        "...": "\\dots",
+        ":::": "\\vdots",
+        "^...": "\\cdots",
+        "^.": "\\cdots"
+    }
+]
+"""
+
+CODE_CONF: str = r"""\definecolor{codegreen}{rgb}{0,0.6,0}
+\definecolor{codegray}{rgb}{0.5,0.5,0.5}
+\definecolor{codepurple}{rgb}{0.58,0,0.82}
+\definecolor{backcolour}{rgb}{0.95,0.95,0.92}
+
+\lstdefinestyle{lstlistings_stylesheet}{
+    backgroundcolor=\color{backcolour},
+    commentstyle=\color{codegreen},
+    keywordstyle=\color{magenta},
+    numberstyle=\tiny\color{codegray},
+    stringstyle=\color{codepurple},
+    basicstyle=\ttfamily\scriptsize,
+    breakatwhitespace=false,
+    breaklines=true,
+    captionpos=b,
+    keepspaces=true,
+    numbers=left,
+    numbersep=5pt,
+    showspaces=false,
+    showstringspaces=false,
+    showtabs=false,
+    tabsize=4
+}
+\lstset{style=lstlistings_stylesheet}
+"""
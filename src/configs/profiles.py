@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BuildProfile:
+    """Dataclass for the flags that the compiler is run with.
+
+    Params:
+        name -- name of the profile.
+        flags -- the flags passed to the compiler in every pass.
+        draft -- whether to run the passes before the last one in draft
+            mode, in which the pdf is not written.
+    """
+
+    name: str
+    flags: tuple[str, ...]
+    draft: bool = False
+
+
+PROFILES: dict[str, BuildProfile] = {
+        "final": BuildProfile(
+            "final", ("-synctex=1", "-interaction=nonstopmode")
+        ),
+        "fast": BuildProfile(
+            "fast", ("-interaction=batchmode", "-halt-on-error")
+        ),
+        "draft": BuildProfile(
+            "draft", ("-synctex=1", "-interaction=nonstopmode"), True
+        )
+    }
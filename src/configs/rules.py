@@ -1,4 +1,34 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from re import compile, Pattern
+
+# marker, pattern and the name of the rule of the inline formatting.
+Marker = tuple[str, Pattern[str], str]
+
+
+@dataclass(frozen=True)
+class CompiledRules:
+    """Dataclass of the rules with the patterns compiled and the markers
+    computed in advance, so that the parser does not need to do it in
+    every line.
+
+    Params:
+        files -- the type of files that simtex will convert.
+        image -- compiled pattern of the image.
+        links -- compiled pattern of the links.
+        inline_math -- compiled pattern of the inline math.
+        inline_code -- compiled pattern of the inline code.
+        align -- markers of the align environment.
+        markers -- the markers of the inline formatting, indexed by their
+            first character, in order of precedence.
+    """
+
+    files: tuple[str, ...]
+    image: Pattern[str]
+    links: Pattern[str]
+    inline_math: Pattern[str]
+    inline_code: Pattern[str]
+    align: tuple[str, ...]
+    markers: dict[str, list[Marker]]
 
 
 @dataclass(frozen=True)
@@ -63,3 +93,46 @@ class Rules:
     quote: list[str]
     bquote: str
     nonum: str
+    compiled: CompiledRules = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compile the patterns of the rules, this raises re.error if
+        there is an invalid pattern."""
+
+        inline: list[tuple[str, list[str]]] = [
+                ("quote", self.quote),
+                ("bold", self.bold),
+                ("italics", self.italics),
+                ("emph", self.emph),
+                ("strike", self.strike),
+                ("supscript", self.supscript),
+                ("subscript", self.subscript),
+                ("uline", self.uline)
+            ]
+
+        markers: dict[str, list[Marker]] = {}
+
+        name: str; rule: list[str]
+        for name, rule in inline:
+            if rule[0]:
+                markers.setdefault(rule[0][0], []).append(
+                    (rule[0], compile(rule[1]), name)
+                )
+
+        object.__setattr__(
+            self,
+            "compiled",
+            CompiledRules(
+                tuple(self.files),
+                compile(self.image),
+                compile(self.links),
+                compile(self.inline_math[1]),
+                compile(self.inline_code[1]),
+                (
+                    self.paragraph_math,
+                    f"{self.paragraph_math}--",
+                    f"{self.paragraph_math} --"
+                ),
+                markers
+            )
+        )
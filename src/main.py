@@ -1,8 +1,17 @@
-from src.cli import Cli
+from sys import argv
+
+from src.utils.client import forward
 
 
 def main() -> None:
-    """Main program that calls the argument parser."""
+    """Main program that calls the argument parser, unless a server is
+    running, to which the arguments are forwarded."""
+
+    if (returncode := forward(argv[1:])) is not None:
+        raise SystemExit(returncode)
+
+    # imported only when converting in this process, since it is slow.
+    from src.cli import Cli
 
     cli_: Cli = Cli()
     cli_.cli()
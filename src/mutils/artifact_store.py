@@ -0,0 +1,140 @@
+from os import listdir, makedirs, rename, utime
+from os.path import getmtime, getsize, isdir, join
+from shutil import copyfile, rmtree
+from tempfile import mkdtemp
+
+from src.utils.logger import Logger
+
+
+class ArtifactStore:
+    """Local store of the artifacts of the builds, e.g. the pdf, aux and
+    synctex files, addressed by the hash of everything that the build
+    depends on, so that a build that was done before is restored instead
+    of running the compiler again.
+
+    The entries that were not used for the longest time are evicted
+    once the store is larger than its size.
+
+    Params:
+        log -- for logging.
+        root -- where the artifacts are stored.
+        size -- the maximum size of the store, in bytes.
+    """
+
+    def __init__(self, log: Logger, root: str, size: int) -> None:
+        self.log: Logger = log
+        self.root: str = root
+        self.size: int = size
+
+    def _entry(self, key: str) -> str:
+        """Compute the path of the entry.
+
+        Args:
+            key -- the hash of the build.
+
+        Returns:
+            The directory of the entry.
+        """
+
+        return f"{self.root}/{key[:2]}/{key}"
+
+    def restore(self, key: str, artifacts: dict[str, str]) -> bool:
+        """Copy the artifacts of the build, if it was done before.
+
+        Args:
+            key -- the hash of the build.
+            artifacts -- where each of the artifacts will be written, by
+                their suffix.
+
+        Returns:
+            Whether the artifacts were restored.
+        """
+
+        if not isdir(entry := self._entry(key)):
+            return False
+
+        try:
+            stored: str
+            for stored in listdir(entry):
+                if stored in artifacts:
+                    copyfile(join(entry, stored), artifacts[stored])
+
+            utime(entry) # marks the entry as the most recently used
+        except OSError as Err:
+            self.log.logger(
+                "e", f"{Err}. Cannot restore the build {key}, building ..."
+            )
+            return False
+
+        return True
+
+    def store(self, key: str, artifacts: dict[str, str]) -> None:
+        """Store the artifacts of the build.
+
+        Args:
+            key -- the hash of the build.
+            artifacts -- the artifacts of the build, by their suffix, the
+                ones that do not exist are skipped.
+        """
+
+        entry: str = self._entry(key)
+        if isdir(entry):
+            return None
+
+        try:
+            makedirs(f"{self.root}/{key[:2]}", exist_ok=True)
+
+            # copied into a temporary directory first, so that an entry
+            # is never restored while it is incomplete.
+            tmp: str = mkdtemp(dir=f"{self.root}/{key[:2]}")
+
+            suffix: str; path: str
+            for suffix, path in artifacts.items():
+                try:
+                    copyfile(path, join(tmp, suffix))
+                except FileNotFoundError:
+                    continue
+
+            try:
+                rename(tmp, entry)
+            except OSError: # stored by another build in the meantime
+                rmtree(tmp, ignore_errors=True)
+        except OSError as Err:
+            self.log.logger(
+                "e", f"{Err}. Cannot store the build {key}, skipping ..."
+            )
+
+        return None
+
+    def evict(self) -> None:
+        """Remove the least recently used entries, until the store is
+        not larger than its size."""
+
+        entries: list[tuple[float, int, str]] = []
+        total: int = 0
+
+        try:
+            prefix: str
+            for prefix in listdir(self.root):
+                key: str
+                for key in listdir(f"{self.root}/{prefix}"):
+                    entry: str = f"{self.root}/{prefix}/{key}"
+                    used: int = sum(
+                            getsize(join(entry, stored))
+                            for stored in listdir(entry)
+                        )
+                    entries.append((getmtime(entry), used, entry))
+                    total += used
+        except OSError:
+            return None
+
+        entries.sort() # the least recently used first
+
+        for _, used, entry in entries:
+            if total <= self.size:
+                break
+
+            rmtree(entry, ignore_errors=True)
+            total -= used
+
+        return None
@@ -0,0 +1,254 @@
+import sqlite3
+from hashlib import sha256
+from json import dumps
+from os import makedirs
+from os.path import dirname
+from time import time
+from typing import Optional
+
+from src.metadata.info import PkgInfo
+from src.mutils.fingerprint import fingerprint
+from src.configs.rules import Rules
+from src.configs.replacements import Replacements
+from src.utils.tex.parser.blocks import Block, dump
+from src.utils.logger import Logger
+
+# the new blocks and the use of the cached ones are written once they
+# take this many bytes, so that the memory does not grow with the size
+# of the document.
+BATCH_SIZE: int = 1024*1024
+
+
+class BlockCache:
+    """Persistent cache of the LaTeX of the rendered blocks, addressed by
+    the hash of the markdown of each block and the fingerprint of the
+    rules it was rendered with, so that when a document is edited only
+    the blocks that changed are rendered again.
+
+    The cache is a sqlite database, which is shared by the processes of
+    the pool. The new blocks and the use of the cached ones are written
+    in batches of BATCH_SIZE bytes, and the rest once the document is
+    rendered, see close, and then the blocks that were not used for the
+    longest time are evicted, once the cache is larger than its size.
+
+    Params:
+        log -- for logging.
+        path -- path of the database.
+        size -- the maximum size of the cache, in bytes.
+        salt -- the fingerprint of the rules, and the other parameters of
+            render, which is part of every key.
+        db -- the connection to the database, None if it cannot be used.
+        used -- the keys of the cached blocks that were used, and not yet
+            written.
+        added -- the keys and LaTeX of the new blocks, not yet written.
+        pending -- the size of used and added, in bytes.
+        grown -- whether any block was added, so that the cache is
+            evicted on close.
+    """
+
+    def __init__(
+            self,
+            log: Logger,
+            path: str,
+            size: int,
+            rules: Rules,
+            replacements: Replacements,
+            replace_math_symb: bool,
+            long_rows: int
+        ) -> None:
+        self.log: Logger = log
+        self.path: str = path
+        self.size: int = size
+        self.salt: str = fingerprint(
+                rules,
+                replacements,
+                replace_math_symb,
+                long_rows,
+                PkgInfo.__version__
+            )
+        self.used: list[str] = []
+        self.added: dict[str, str] = {}
+        self.pending: int = 0
+        self.grown: bool = False
+
+        self.db: Optional[sqlite3.Connection] = None
+        try:
+            makedirs(dirname(path), exist_ok=True)
+            self.db = sqlite3.connect(path, timeout=10)
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS blocks ("
+                "key TEXT PRIMARY KEY, latex TEXT, size INTEGER, used REAL)"
+            )
+            self.db.execute(
+                "CREATE INDEX IF NOT EXISTS blocks_used ON blocks (used)"
+            )
+            self.db.commit()
+        except (OSError, sqlite3.Error) as Err:
+            self._disable(f"{Err}. Cannot open the cache of the blocks")
+
+    def _disable(self, message: str) -> None:
+        """Stop using the cache, e.g. if the database is corrupted.
+
+        Args:
+            message -- the reason, which will be logged.
+        """
+
+        self.log.logger("e", f"{message}, skipping ...")
+
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    def key(self, block: Block) -> str:
+        """Compute the key of the block.
+
+        Args:
+            block -- the parsed block.
+
+        Returns:
+            The hash of the block and the rules.
+        """
+
+        return sha256(
+                f"{self.salt}{dumps(dump([block]))}".encode()
+            ).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Fetch the LaTeX of the block, if it was rendered before.
+
+        Args:
+            key -- the key of the block, see key.
+
+        Returns:
+            The LaTeX of the block, or None if it is not cached.
+        """
+
+        if self.db is None:
+            return None
+
+        if (latex := self.added.get(key)) is not None:
+            return latex
+
+        try:
+            row: Optional[tuple[str]] = self.db.execute(
+                    "SELECT latex FROM blocks WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as Err:
+            self._disable(f"{Err}. Cannot read the cache of the blocks")
+            return None
+
+        if row is None:
+            return None
+
+        self.used.append(key)
+        self.pending += len(key)
+        self._write_batch()
+
+        return row[0]
+
+    def put(self, key: str, latex: str) -> None:
+        """Cache the LaTeX of the block, which is written with the next
+        batch.
+
+        Args:
+            key -- the key of the block, see key.
+            latex -- the rendered block.
+        """
+
+        if self.db is not None:
+            self.added[key] = latex
+            self.pending += len(key) + len(latex)
+            self.grown = True
+            self._write_batch()
+
+    def _write_batch(self) -> None:
+        """Write the pending blocks, once they are larger than a batch."""
+
+        if self.pending < BATCH_SIZE:
+            return None
+
+        try:
+            self._write()
+        except sqlite3.Error as Err:
+            self._disable(f"{Err}. Cannot write the cache of the blocks")
+
+        return None
+
+    def _write(self) -> None:
+        """Write the new blocks and the use of the cached ones, which are
+        then dropped from the memory."""
+
+        if self.db is None:
+            return None
+
+        now: float = time()
+        with self.db:
+            self.db.executemany(
+                "UPDATE blocks SET used = ? WHERE key = ?",
+                ((now, key) for key in self.used)
+            )
+            self.db.executemany(
+                "INSERT OR REPLACE INTO blocks VALUES (?, ?, ?, ?)",
+                (
+                    (key, latex, len(key) + len(latex.encode()), now)
+                    for key, latex in self.added.items()
+                )
+            )
+
+        self.used = []
+        self.added = {}
+        self.pending = 0
+
+        return None
+
+    def close(self) -> None:
+        """Write the new blocks and the use of the cached ones, and evict
+        the least recently used blocks if the cache is too large."""
+
+        if self.db is None:
+            return None
+
+        try:
+            self._write()
+            if self.grown:
+                self._evict()
+        except sqlite3.Error as Err:
+            self._disable(f"{Err}. Cannot write the cache of the blocks")
+            return None
+
+        self.db.close()
+        self.db = None
+
+        return None
+
+    def _evict(self) -> None:
+        """Remove the least recently used blocks, until the cache is not
+        larger than its size."""
+
+        if self.db is None:
+            return None
+
+        total: int = self.db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM blocks"
+            ).fetchone()[0]
+        if total <= self.size:
+            return None
+
+        # the least recently used first
+        stale: list[str] = []
+        key: str; used: int
+        for key, used in self.db.execute(
+                "SELECT key, size FROM blocks ORDER BY used"
+            ):
+            if total <= self.size:
+                break
+
+            stale.append(key)
+            total -= used
+
+        with self.db:
+            self.db.executemany(
+                "DELETE FROM blocks WHERE key = ?", ((key,) for key in stale)
+            )
+
+        return None
@@ -1,28 +1,450 @@
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from hashlib import sha256
+from os import getpid, makedirs, replace
+from os.path import (
+        basename, dirname, exists, getmtime, getsize, join, realpath
+    )
+from re import compile, Pattern
 from shutil import which
-from subprocess import (
-    run,
-    CalledProcessError,
-    DEVNULL
-)
-from typing import NoReturn
+from subprocess import DEVNULL, run, STDOUT
+from threading import get_ident
+from typing import IO, Any, NoReturn, Optional
 
+from src.configs.formats import ENDOFDUMP, FORMAT_COMPILERS
+from src.configs.profiles import BuildProfile, PROFILES
+from src.mutils.artifact_store import ArtifactStore
 from src.utils.logger import Logger
 
+# the files that the builds depend on, besides the LaTeX file.
+ASSETS: Pattern[str] = compile(r"\\includegraphics(?:\[[^]]*\])?\{([^}]+)\}")
 
-def build_file(
+# the files that are read back by the next pass of the build, the build
+# is rerun until none of them changes.
+PASS_FILES: tuple[str, ...] = (".aux", ".out", ".toc")
+
+# the hints in the log of the compiler that another pass is needed.
+RERUN: Pattern[str] = compile(
+        r"Rerun to get|Rerun LaTeX|Label\(s\) may have changed"
+        r"|File `[^']*' has changed|No file [^\n]*\.(?:toc|out)\."
+    )
+
+# the artifacts of the build that are stored, by their suffix.
+ARTIFACTS: tuple[str, ...] = (
+        ".pdf", ".aux", ".toc", ".out", ".synctex.gz", ".build.log"
+    )
+
+
+@dataclass
+class BuildJob:
+    """Result of a single build in a batch.
+
+    Params:
+        filename -- name of the LaTeX file.
+        returncode -- return code of the compiler.
+        log_file -- where the output of the compiler was written.
+    """
+
+    filename: str
+    returncode: int
+    log_file: str
+
+
+def _tex_version(compiler: str) -> str:
+    """Identify the TeX installation, so that the formats dumped by
+    another installation are not loaded.
+
+    The formats are dumped with mylatexformat, thus it is part of the
+    installation, and the dumps that failed without it are retried once
+    it is installed or updated.
+
+    Args:
+        compiler -- the compiler to use.
+
+    Returns:
+        The version of the compiler and the mtime of its binary, and the
+        path and mtime of mylatexformat, if it is installed.
+    """
+
+    try:
+        version: str = run(
+                [compiler, "--version"],
+                capture_output=True,
+                text=True
+            ).stdout.partition("\n")[0]
+        mtime: float = getmtime(realpath(which(compiler) or compiler))
+    except OSError:
+        return ""
+
+    package: str = ""
+    try:
+        package = run(
+                ["kpsewhich", "mylatexformat.ltx"],
+                capture_output=True,
+                text=True
+            ).stdout.strip()
+        if package:
+            package = f"{package} {getmtime(package)}"
+    except OSError: # kpsewhich is not installed
+        package = ""
+
+    return f"{version} {mtime} {package}"
+
+
+def _format_name(filename: str, version: str) -> Optional[str]:
+    """Compute the name of the format of the preamble of the file.
+
+    Args:
+        filename -- name of the LaTeX file.
+        version -- the TeX installation, see _tex_version.
+
+    Returns:
+        The hash of the preamble and the TeX installation, or None if the
+        file has no end of preamble marker.
+    """
+
+    preamble: list[str] = [version]
+
+    try:
+        tex: IO[Any]
+        with open(filename, "r", encoding="utf-8") as tex:
+            line: str
+            for line in tex:
+                if line.strip() == ENDOFDUMP:
+                    return sha256(
+                            "".join(preamble).encode()
+                        ).hexdigest()[:32]
+
+                preamble.append(line)
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    return None
+
+
+def _dump_format(
         log: Logger,
         compiler: str,
-        output_folder: str,
         filename: str,
-        verbose: bool
-    ) -> None | NoReturn:
-    """Build the LaTeX file using pdflatex, if exists.
+        name: str,
+        format_dir: str
+    ) -> Optional[str]:
+    """Dump the preamble of the file into a format, if not yet dumped.
 
     Args:
         log -- for logging.
+        compiler -- the compiler to use.
+        filename -- name of the LaTeX file, whose preamble will be dumped.
+        name -- name of the format, see _format_name.
+        format_dir -- where the dumped formats are stored.
+
+    Returns:
+        The path of the format, without the extension, or None if it
+        cannot be dumped, e.g. mylatexformat is not installed.
+    """
+
+    fmt: str = f"{format_dir}/{name}"
+    if exists(f"{fmt}.fmt"):
+        return fmt
+    elif exists(f"{fmt}.failed"): # already reported when it failed
+        return None
+
+    log.logger("I", "Precompiling the preamble ...")
+
+    # dumped under a temporary name, so that the other builds never load
+    # an incomplete format.
+    job: str = f"{name}-{getpid()}-{get_ident()}"
+    try:
+        makedirs(format_dir, exist_ok=True)
+        run(
+            [
+                compiler,
+                "-ini",
+                "-interaction=nonstopmode",
+                f"-jobname={job}",
+                f"-output-directory={format_dir}",
+                f"&{basename(compiler)}",
+                "mylatexformat.ltx",
+                filename
+            ],
+            stdout=DEVNULL,
+            stderr=STDOUT
+        )
+
+        if exists(f"{format_dir}/{job}.fmt"):
+            replace(f"{format_dir}/{job}.fmt", f"{fmt}.fmt")
+            return fmt
+
+        # not retried until the config or the TeX installation changes,
+        # see _tex_version.
+        open(f"{fmt}.failed", "w", encoding="utf-8").close()
+    except OSError:
+        pass
+
+    log.logger(
+        "e",
+        "Cannot precompile the preamble, is mylatexformat installed?"
+        f" See: {format_dir}/{job}.log, building without it ..."
+    )
+
+    return None
+
+
+def _build_key(
+        compiler: str,
+        version: str,
+        filename: str,
+        fmt: Optional[str],
+        passes: int,
+        profile: BuildProfile,
+        cwd: Optional[str] = None
+    ) -> str:
+    """Compute the hash of everything the build of the file depends on.
+
+    Args:
+        compiler -- the compiler to use.
+        version -- the TeX installation, see _tex_version.
+        filename -- name of the LaTeX file.
+        fmt -- the format with the precompiled preamble to load, if any.
+        passes -- the maximum number of passes of the build.
+        profile -- the flags of the compiler.
+        cwd -- where the compiler is run, see _compile.
+
+    Returns:
+        The hash of the compiler, its flags, the LaTeX file and the files
+        it includes.
+    """
+
+    key: Any = sha256(
+            "\0".join(
+                [
+                    basename(compiler),
+                    version,
+                    *profile.flags,
+                    str(profile.draft),
+                    fmt or "",
+                    str(passes)
+                ]
+            ).encode()
+        )
+
+    tex: IO[bytes]
+    with open(filename, "rb") as tex:
+        content: bytes = tex.read()
+    key.update(content)
+
+    asset: str
+    for asset in ASSETS.findall(content.decode("utf-8", "replace")):
+        key.update(f"\0{asset}\0".encode())
+
+        # searched from where the compiler is run, then beside the file.
+        path: str
+        for path in (join(cwd or "", asset), join(dirname(filename), asset)):
+            try:
+                with open(path, "rb") as tex:
+                    key.update(tex.read())
+                break
+            except OSError:
+                continue
+
+    return str(key.hexdigest())
+
+
+def _artifacts(output_folder: str, filename: str) -> dict[str, str]:
+    """Compute the path of each of the artifacts of the build.
+
+    Args:
+        output_folder -- where the built pdf and its file will be
+            placed.
+        filename -- name of the LaTeX file.
+
+    Returns:
+        The path of the artifacts, by their suffix.
+    """
+
+    name: str = basename(filename).removesuffix(".tex")
+    artifacts: dict[str, str] = {
+            suffix: f"{output_folder}/{name}{suffix}" for suffix in ARTIFACTS
+        }
+    artifacts[".build.log"] = f"{filename.removesuffix('.tex')}.build.log"
+
+    return artifacts
+
+
+def _pass_state(output_folder: str, filename: str) -> dict[str, str]:
+    """Compute the hash of the files that are read back by the next pass.
+
+    Args:
+        output_folder -- where the built pdf and its file will be
+            placed.
+        filename -- name of the LaTeX file.
+
+    Returns:
+        The hash of each of the files, by their suffix, the ones that do
+        not exist are skipped.
+    """
+
+    name: str = basename(filename).removesuffix(".tex")
+    state: dict[str, str] = {}
+
+    suffix: str
+    for suffix in PASS_FILES:
+        try:
+            aux: IO[bytes]
+            with open(f"{output_folder}/{name}{suffix}", "rb") as aux:
+                state[suffix] = sha256(aux.read()).hexdigest()
+        except OSError:
+            continue
+
+    return state
+
+
+def _needs_rerun(output_folder: str, filename: str) -> bool:
+    """Check the log of the compiler for the hints of another pass.
+
+    Args:
         output_folder -- where the built pdf and its file will be
             placed.
         filename -- name of the LaTeX file.
+
+    Returns:
+        Whether the log asks for another pass.
+    """
+
+    name: str = basename(filename).removesuffix(".tex")
+
+    try:
+        tex_log: IO[Any]
+        with open(
+                f"{output_folder}/{name}.log",
+                "r",
+                encoding="utf-8",
+                errors="replace"
+            ) as tex_log:
+            return RERUN.search(tex_log.read()) is not None
+    except OSError:
+        return False
+
+
+def _compile(
+        compiler: str,
+        output_folder: str,
+        filename: str,
+        log_file: str,
+        fmt: Optional[str] = None,
+        passes: int = 1,
+        profile: BuildProfile = PROFILES["final"],
+        cwd: Optional[str] = None
+    ) -> int:
+    """Run the compiler on the file, and write its output to the log.
+
+    The compiler is run again as long as the aux, out or toc files change
+    or the log asks for it, up to the given number of passes, thus the
+    documents without references are built only once. With a draft
+    profile, the passes are run in draft mode until then, and the pdf is
+    written only by one last pass.
+
+    Args:
+        compiler -- the compiler to use.
+        output_folder -- where the built pdf and its file will be
+            placed.
+        filename -- name of the LaTeX file.
+        log_file -- where the output of the compiler will be written.
+        fmt -- the format with the precompiled preamble to load, if any.
+        passes -- the maximum number of passes.
+        profile -- the flags of the compiler.
+        cwd -- where the compiler is run, which the paths of the
+            included files are relative to, the current directory if None.
+
+    Returns:
+        The return code of the last pass of the compiler.
+    """
+
+    cmd: list[str] = [
+            compiler,
+            *profile.flags,
+            f"-output-directory={output_folder}",
+            filename
+        ]
+    if fmt is not None:
+        cmd.insert(1, f"-fmt={fmt}")
+
+    # xelatex writes no pdf with -no-pdf, instead of -draftmode.
+    draft_cmd: list[str] = cmd.copy()
+    draft_cmd.insert(
+        1, "-no-pdf" if basename(compiler) == "xelatex" else "-draftmode"
+    )
+
+    state: dict[str, str] = _pass_state(output_folder, filename)
+    drafting: bool = profile.draft
+
+    rcode: int = 0
+    current: int
+    for current in range(1, max(1, passes)+1):
+        draft: bool = drafting and current < passes
+
+        out: IO[Any]
+        with open(log_file, "w", encoding="utf-8") as out:
+            rcode = run(
+                    draft_cmd if draft else cmd,
+                    stdout=out,
+                    stderr=STDOUT,
+                    cwd=cwd
+                ).returncode
+
+        if rcode != 0:
+            break
+
+        # the files that did not exist were not read by the pass, the
+        # compiler tells in the log if it needs them.
+        previous: dict[str, str] = state
+        state = _pass_state(output_folder, filename)
+        if not _needs_rerun(output_folder, filename) and all(
+                state.get(suffix) == digest
+                for suffix, digest in previous.items()
+            ):
+            if not draft:
+                break # reached a fixed point
+
+            drafting = False # the next pass writes the pdf
+
+    return rcode
+
+
+def build_files(
+        log: Logger,
+        compiler: str,
+        output_folder: str,
+        files: list[str],
+        verbose: bool,
+        jobs: int,
+        store: Optional[ArtifactStore],
+        passes: int,
+        profile: BuildProfile,
+        format_dir: str,
+        cwd: Optional[str] = None
+    ) -> list[BuildJob] | NoReturn:
+    """Build the LaTeX files with up to the given number of compilers
+    running at once. The largest files are started first, since they
+    take the longest to build, and the builds that were done before are
+    restored from the store instead.
+
+    Args:
+        log -- for logging.
+        compiler -- the compiler to use.
+        output_folder -- where the built pdf and its file will be
+            placed.
+        files -- the LaTeX files to build.
+        verbose -- whether to print the output of the compiler.
+        jobs -- number of compilers to run at once.
+        store -- where the artifacts of the builds are stored, if any.
+        passes -- the maximum number of passes of each build.
+        profile -- the flags of the compiler.
+        format_dir -- where the precompiled preambles are stored.
+        cwd -- where the compilers are run, see _compile.
+
+    Returns:
+        The result of each build, in the same order as the files.
     """
 
     if which(compiler) is None:
@@ -31,31 +453,118 @@ def build_file(
         )
         raise SystemExit
 
+    order: list[str] = files.copy()
     try:
-        log.logger("I", f"Building {filename} with {compiler} ...")
-        cmd: list[str] = [
-                compiler,
-                "-synctex=1",
-                "-interaction=nonstopmode",
-                f"-output-directory={output_folder}",
-                filename
-            ]
+        order.sort(key=getsize, reverse=True)
+    except OSError:
+        pass
 
-        if verbose:
-            rcode = run(cmd).returncode
-        else:
-            rcode = run(cmd, stdout=DEVNULL).returncode
+    results: dict[str, BuildJob] = {}
 
-        if rcode != 0:
-            raise CalledProcessError(rcode, cmd)
-        else:
-            log.logger("I", "Successfully built the file.")
-    except (OSError, CalledProcessError) as Err:
-        log.logger("E", f"{Err}. Cannot build LaTeX file.")
-        print(
-            "\033[34mINFO\033[0m\t Try updating "
-            "the compiler parameter in simtex.json"
-        )
-        raise SystemExit
+    # the preambles are dumped once, before any of the builds start.
+    dumped: dict[str, Optional[str]] = {}
+    formats: dict[str, Optional[str]] = {}
+    version: str = _tex_version(compiler)
 
-    return None
+    file: str
+    if basename(compiler) in FORMAT_COMPILERS:
+        for file in order:
+            if (name := _format_name(file, version)) is None:
+                continue
+
+            if name not in dumped:
+                dumped[name] = _dump_format(
+                        log, compiler, file, name, format_dir
+                    )
+            formats[file] = dumped[name]
+
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(max(1, jobs))
+    try:
+        builds: dict[Future[int], tuple[str, str, Optional[str]]] = {}
+
+        for file in order:
+            log_file: str = f"{file.removesuffix('.tex')}.build.log"
+
+            key: Optional[str] = None
+            if store is not None:
+                try:
+                    key = _build_key(
+                            compiler,
+                            version,
+                            file,
+                            formats.get(file),
+                            passes,
+                            profile,
+                            cwd
+                        )
+                except OSError:
+                    pass
+
+            if key is not None and store is not None and store.restore(
+                    key, _artifacts(output_folder, file)
+                ):
+                log.logger("I", f"Restored the build of {file}.")
+                results[file] = BuildJob(file, 0, log_file)
+                continue
+
+            builds[
+                executor.submit(
+                    _compile,
+                    compiler,
+                    output_folder,
+                    file,
+                    log_file,
+                    formats.get(file),
+                    passes,
+                    profile,
+                    cwd
+                )
+            ] = (file, log_file, key)
+
+        if builds:
+            log.logger(
+                "I",
+                f"Building {len(builds)} files with {compiler}"
+                f" using {max(1, jobs)} jobs ..."
+            )
+
+        build: Future[int]
+        for build in as_completed(builds):
+            file, log_file, key = builds[build]
+            try:
+                rcode: int = build.result()
+            except OSError as Err:
+                log.logger("e", f"{Err}. Cannot build {file}.")
+                rcode = -1
+
+            results[file] = BuildJob(file, rcode, log_file)
+
+            if verbose:
+                try:
+                    out: IO[Any]
+                    with open(log_file, "r", encoding="utf-8") as out:
+                        print(out.read())
+                except (OSError, UnicodeDecodeError):
+                    pass
+
+            if rcode != 0:
+                log.logger(
+                    "e",
+                    f"Cannot build {file} (return code: {rcode}),"
+                    f" see: {log_file}."
+                )
+            else:
+                log.logger("I", f"Successfully built {file}.")
+
+                if key is not None and store is not None:
+                    store.store(key, _artifacts(output_folder, file))
+    except KeyboardInterrupt:
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    else:
+        executor.shutdown()
+
+    if store is not None:
+        store.evict()
+
+    return [results[file] for file in files]
@@ -1,6 +1,3 @@
-from collections import Counter
-
-
 def check_if_table(cur_line: str, sec_line: str) -> bool:
     """Check if the line is a beginning of a table.
 
@@ -15,7 +12,7 @@ def check_if_table(cur_line: str, sec_line: str) -> bool:
         Whether the line is a beginning of table or not.
     """
 
-    if Counter(cur_line)["|"] > 1 and Counter(sec_line)["-"] > 3:
+    if cur_line.count("|") > 1 and sec_line.count("-") > 3:
         return True
 
     return False
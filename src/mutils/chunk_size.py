@@ -0,0 +1,39 @@
+from os.path import getsize
+
+# number of chunks each worker should receive, so that a worker that
+# draws the larger files does not leave the others idle at the end.
+CHUNKS_PER_JOB: int = 4
+
+
+def chunk_size(files: list[str], jobs: int) -> int:
+    """Compute the number of files that will be sent to a worker at once.
+
+    The chunks aim to carry the same amount of bytes, which is estimated
+    with the median size of the files, thus a few large files would not
+    inflate the chunks of the rest.
+
+    Args:
+        files -- the files that will be converted.
+        jobs -- number of workers in the pool.
+
+    Returns:
+        The chunk size to be used by the pool.
+    """
+
+    if not files or jobs < 1:
+        return 1
+
+    sizes: list[int] = []
+
+    file: str
+    for file in files:
+        try:
+            sizes.append(getsize(file))
+        except OSError:
+            sizes.append(0)
+
+    sizes.sort()
+    median: int = sizes[len(sizes)//2] or 1
+    target: float = sum(sizes)/(jobs*CHUNKS_PER_JOB)
+
+    return max(1, min(len(files)//jobs, int(target//median)))
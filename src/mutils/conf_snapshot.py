@@ -0,0 +1,135 @@
+from dataclasses import fields
+from hashlib import sha256
+from os import getpid, makedirs, replace, stat
+from os.path import abspath, expanduser
+from pickle import HIGHEST_PROTOCOL, UnpicklingError, dump, load
+from threading import get_ident
+from typing import IO, Any, Optional
+
+from src.configs.config import Config
+from src.configs.rules import Rules
+from src.configs.replacements import Replacements
+from src.metadata.info import PkgInfo
+from src.utils.logger import Logger
+
+# where the snapshots are stored, it cannot be read from the config.
+SNAPSHOT_DIR: str = f"{expanduser('~')}/.cache/simtex"
+
+
+class ConfSnapshot:
+    """Snapshot of the parsed config, i.e. the config, the rules with
+    their compiled patterns, and the replacements, so that simtex.json
+    is parsed only when it changes.
+
+    The snapshot is keyed by the mtime and size of simtex.json, the
+    version of simtex and the fields of the dataclasses, thus it is never
+    loaded into dataclasses of a different layout.
+
+    Params:
+        log -- for logging.
+        conf_file -- path of simtex.json.
+        path -- path of the snapshot.
+    """
+
+    def __init__(self, log: Logger, conf_file: str) -> None:
+        self.log: Logger = log
+        self.conf_file: str = conf_file
+        self.path: str = (
+                f"{SNAPSHOT_DIR}/config-"
+                f"{sha256(abspath(conf_file).encode()).hexdigest()[:16]}"
+                ".pickle"
+            )
+
+    def key(self) -> Optional[tuple[Any, ...]]:
+        """Compute the key of the config file, it needs to be computed
+        before the file is read, so that a change while it is read is not
+        missed.
+
+        Returns:
+            The key, or None if the config file cannot be read.
+        """
+
+        try:
+            info: Any = stat(self.conf_file)
+        except OSError:
+            return None
+
+        return (
+                info.st_mtime_ns,
+                info.st_size,
+                PkgInfo.__version__,
+                tuple(
+                    tuple(field.name for field in fields(dataclass))
+                    for dataclass in (Config, Rules, Replacements)
+                )
+            )
+
+    def load(self) -> Optional[tuple[Config, Rules, Replacements]]:
+        """Load the snapshot, if the config file did not change since.
+
+        Returns:
+            The config, the rules and the replacements, or None if the
+            config file needs to be parsed.
+        """
+
+        if (key := self.key()) is None:
+            return None
+
+        try:
+            snapshot: IO[bytes]
+            with open(self.path, "rb") as snapshot:
+                stored: Any = load(snapshot)
+        except (
+                OSError,
+                EOFError,
+                UnpicklingError,
+                AttributeError,
+                ImportError,
+                TypeError,
+                ValueError
+            ):
+            return None
+
+        if (
+                isinstance(stored, tuple)
+                and len(stored) == 2
+                and stored[0] == key
+                and isinstance(conf := stored[1], tuple)
+                and len(conf) == 3
+                and isinstance(conf[0], Config)
+                and isinstance(conf[1], Rules)
+                and isinstance(conf[2], Replacements)
+            ):
+            return (conf[0], conf[1], conf[2])
+
+        return None
+
+    def save(
+            self,
+            key: Optional[tuple[Any, ...]],
+            conf: tuple[Config, Rules, Replacements]
+        ) -> None:
+        """Store the snapshot, replacing the previous one at once.
+
+        Args:
+            key -- the key of the config file before it was read.
+            conf -- the parsed config, rules and replacements.
+        """
+
+        if key is None:
+            return None
+
+        tmp: str = f"{self.path}.{getpid()}-{get_ident()}"
+        try:
+            makedirs(SNAPSHOT_DIR, exist_ok=True)
+
+            snapshot: IO[bytes]
+            with open(tmp, "wb") as snapshot:
+                dump((key, conf), snapshot, protocol=HIGHEST_PROTOCOL)
+            replace(tmp, self.path)
+        except OSError as Err:
+            self.log.logger(
+                "e", f"{Err}. Cannot write {self.path}, skipping ..."
+            )
+
+        return None
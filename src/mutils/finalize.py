@@ -1,3 +1,4 @@
+from os.path import basename, dirname, join, normpath
 from shutil import copy
 
 from src.utils.logger import Logger
@@ -19,19 +20,16 @@ def finalize(
         The path of the file, or raises systemexit.
     """
 
-    if origin.startswith("./"):
-        OPATH = "/".join(origin.split("/")[:-1])
-    else:
-        OPATH = "./"+"/".join(origin.split("/")[:-1])
+    # the paths are relative to the input file, unless absolute.
+    OPATH: str = dirname(origin)
 
     file: str
     for file in files:
         log.logger("I", f"Copying {file} into {output_folder} ...")
-        filename: str = file.split("/")[-1]
         try:
             copy(
-                f"{OPATH}/{file.replace('./', '')}",
-                f"{output_folder}/{filename}"
+                normpath(join(OPATH, file)),
+                join(output_folder, basename(file))
             )
         except (FileNotFoundError, OSError, IOError) as Err:
             log.logger(
@@ -2,7 +2,9 @@ from os import walk
 from os.path import join
 
 
-def find_files(PATH: str, filetypes: str | list[str]) -> list[str]:
+def find_files(
+        PATH: str, filetypes: str | list[str] | tuple[str, ...]
+    ) -> list[str]:
     """Find files to convert in the given path.
 
     Args:
@@ -14,11 +16,14 @@ def find_files(PATH: str, filetypes: str | list[str]) -> list[str]:
     """
 
     files: list[str] = []
+    endings: str | tuple[str, ...] = (
+            filetypes if isinstance(filetypes, str) else tuple(filetypes)
+        )
 
     root: str; dir: str | list[str]
     for root, _, dir in walk(PATH):
         for file in dir:
-            if file.endswith(tuple(filetypes)):
+            if file.endswith(endings):
                 files.append(join(root, file))
 
     return files
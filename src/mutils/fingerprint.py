@@ -0,0 +1,42 @@
+from dataclasses import fields, is_dataclass
+from hashlib import sha256
+from json import dumps
+from typing import Any
+
+
+def _fields(obj: Any) -> dict[str, Any]:
+    """Convert a dataclass into a dict, for json.
+
+    Args:
+        obj -- the dataclass, the fields that are not compared, e.g. the
+            compiled patterns, are left out, since they are computed from
+            the other fields.
+
+    Returns:
+        The fields of the dataclass.
+    """
+
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {
+                field.name: getattr(obj, field.name)
+                for field in fields(obj) if field.compare
+            }
+
+    raise TypeError(f"Cannot fingerprint: {type(obj).__name__}")
+
+
+def fingerprint(*parts: Any) -> str:
+    """Compute a stable hash of the configs and values, which changes
+    only if any of them changes.
+
+    Args:
+        parts -- the configs and values, which are either dataclasses or
+            can be converted to json.
+
+    Returns:
+        The hash of the parts.
+    """
+
+    return sha256(
+            dumps(parts, sort_keys=True, default=_fields).encode()
+        ).hexdigest()
@@ -29,7 +29,10 @@ def fix_file_path(
 
     if not exists(output_folder):
         log.logger("I", f"Creating dir: {output_folder} ...")
-        mkdir(output_folder)
+        try:
+            mkdir(output_folder)
+        except FileExistsError: # created by another job in the meantime
+            pass
 
     if not filename or filename is None:
         in_filename: str = in_file.split("/")[-1].split(".")[0].strip()
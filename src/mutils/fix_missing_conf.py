@@ -1,7 +1,6 @@
-from typing import NoReturn
-
-from requests import get
+from typing import NoReturn, TextIO
 
+from src.configs.gen.defaults import CODE_CONF, SIMTEX_JSON
 from src.mutils.merge_conf import merge_conf
 from src.mutils.prompts import prompt
 from src.utils.logger import Logger
@@ -16,7 +15,9 @@ def fix_missing_config(
         code_conf: bool = False,
         missing: bool = True
     ) -> None | NoReturn:
-    """Downloads the original config file from github if not found.
+    """Write the default config file, which is bundled with simtex, if
+    it is not found, or merge it into the config if it is missing some
+    parameters.
 
     Args:
         log -- for logging.
@@ -29,57 +30,40 @@ def fix_missing_config(
             missing parameters.
     """
 
-    # this was done instead of packaging the config from
-    # package data, so that the user will be able to
-    # interact with the config file easily.
-    branch: str = "devel" if not missing else "main"
+    log.logger("e", log_msg)
 
-    if conf:
-        link: str = (
-                "https://raw.githubusercontent.com/iaacornus"
-                f"/simtex/{branch}/examples/config/simtex.json"
-            )
-        filename: str = "simtex.json" if missing else "simtex.json.bak"
-    elif code_conf:
-        link = (
-                "https://raw.githubusercontent.com/iaacornus"
-                f"/simtex/{branch}/examples/config/code_conf.txt"
-            )
-        filename = "code_conf.txt"
+    # the config is written into the config folder instead of being read
+    # from the package, so that the user will be able to interact with
+    # the config file easily.
+    if conf and not missing:
+        if not prompt(
+                (
+                    "Config is missing some parameters. Add the default "
+                    "values of the parameters to \033[36msimtex.json"
+                    "\033[0m? [y/n] "
+                ),
+                assume_yes
+            ):
+            log.logger("E", "Cannot fix config error, aborting ...")
+            raise SystemExit
 
-    if not prompt(
-            (
-                "Config is missing. Download the base config (\033[36m"
-                f"{filename}\033[0m) from \033[36m{link}\033[0m? [y/n] "
-            ),
-            assume_yes
-        ):
-        log.logger("E", "Cannot fix config error, aborting ...")
-        raise SystemExit
+        log.logger("I", "Updating existing config file ...")
+        merge_conf(log, CONF_PATH)
+        return None
 
-    trial: int
-    for trial in range(3):
-        try:
-            log.logger("e", log_msg)
-            with get(link, stream=True) as d_file:
-                with open(
-                        f"{CONF_PATH}/{filename}", "wb"
-                    ) as conf_file:
-                    for chunk in d_file.iter_content(chunk_size=1024):
-                        if chunk:
-                            conf_file.write(chunk)
-        except (ConnectionError, IOError, PermissionError) as Err:
-            if trial < 2:
-                continue
+    filename: str = "simtex.json" if conf else "code_conf.txt"
+    try:
+        conf_file: TextIO
+        with open(
+                f"{CONF_PATH}/{filename}", "w", encoding="utf-8"
+            ) as conf_file:
+            conf_file.write(SIMTEX_JSON if conf else CODE_CONF)
+    except (IOError, PermissionError) as Err:
+        log.logger(
+            "E", f"{Err}. Cannot write {filename}, aborting ..."
+        )
+        raise SystemExit
 
-            log.logger(
-                "E", f"{Err}. Cannot download {filename}, aborting ..."
-            )
-        else:
-            log.logger("I", f"Sucessfully fetched: {filename}.")
-            if not missing:
-                log.logger("I", "Updating existing config file ...")
-                merge_conf(log, CONF_PATH)
-            return None
+    log.logger("I", f"Sucessfully written the default {filename}.")
 
-    raise SystemExit
+    return None
@@ -0,0 +1,57 @@
+from collections import deque
+from typing import Iterable, Iterator, Optional
+
+
+class LineCursor:
+    """Cursor over the lines of the input file, shared by the parser and
+    the environments, each of them consumes the lines that belong to it
+    and leaves the cursor at the line after, thus no line is copied or
+    visited twice.
+
+    The lines are read from the source only when they are needed, and
+    only the lines that are looked ahead are kept, thus the memory used
+    does not grow with the size of the input file.
+
+    Params:
+        lines -- the source of the lines, e.g. the input file.
+        ahead -- the lines that are looked ahead but not yet consumed.
+    """
+
+    __slots__ = ("lines", "ahead")
+
+    def __init__(self, lines: Iterable[str]) -> None:
+        self.lines: Iterator[str] = iter(lines)
+        self.ahead: deque[str] = deque()
+
+    def __iter__(self) -> "LineCursor":
+        return self
+
+    def __next__(self) -> str:
+        """Consume the next line.
+
+        Returns:
+            The next line, or raises StopIteration if there is none.
+        """
+
+        if self.ahead:
+            return self.ahead.popleft()
+
+        return next(self.lines)
+
+    def peek(self, offset: int = 0) -> Optional[str]:
+        """Look at a line ahead without consuming it.
+
+        Args:
+            offset -- how many lines after the next line to look at.
+
+        Returns:
+            The line, or None if it is past the end of the file.
+        """
+
+        while len(self.ahead) <= offset:
+            try:
+                self.ahead.append(next(self.lines))
+            except StopIteration:
+                return None
+
+        return self.ahead[offset]
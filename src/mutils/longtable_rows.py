@@ -0,0 +1,22 @@
+from src.configs.config import Config
+
+
+def longtable_rows(config: Config) -> int:
+    """Find the number of rows after which a table is written as a
+    longtable, which needs the longtable package.
+
+    Args:
+        config -- configuration of the document metadata, which includes,
+            formatting, packages to use among others, refer to simtex.json.
+
+    Returns:
+        The number of rows, 0 if the package is not used.
+    """
+
+    if any(
+            (pkg[0] if isinstance(pkg, list) else pkg) == "longtable"
+            for pkg in config.packages if pkg
+        ):
+        return config.longtable_rows
+
+    return 0
@@ -0,0 +1,126 @@
+from hashlib import sha256
+from json import JSONDecodeError, dump, load
+from os import getpid, replace
+from os.path import abspath, exists
+from threading import get_ident
+from typing import IO, Any, Optional
+
+from src.metadata.info import PkgInfo
+from src.utils.logger import Logger
+
+# name of the manifest in the output folder.
+MANIFEST: str = ".simtex-manifest.json"
+
+
+def source_hash(in_file: str) -> str:
+    """Compute the hash of the content of the input file.
+
+    Args:
+        in_file -- path of the input file.
+
+    Returns:
+        The hash of the file.
+    """
+
+    digest: Any = sha256()
+
+    src: IO[bytes]
+    with open(in_file, "rb") as src:
+        while (chunk := src.read(1 << 20)):
+            digest.update(chunk)
+
+    return str(digest.hexdigest())
+
+
+class Manifest:
+    """Record of the files converted into the output folder, which is
+    used to skip the inputs that did not change since they were last
+    converted.
+
+    Each input is recorded with the hash of its content, the fingerprint
+    of the config it was converted with, the version of simtex and the
+    path of its output.
+
+    Params:
+        log -- for logging.
+        path -- path of the manifest.
+        entries -- the recorded inputs, by their absolute path.
+    """
+
+    def __init__(self, log: Logger, output_folder: str) -> None:
+        self.log: Logger = log
+        self.path: str = f"{output_folder}/{MANIFEST}"
+        self.entries: dict[str, dict[str, str]] = {}
+
+        try:
+            manifest: IO[Any]
+            with open(self.path, "r", encoding="utf-8") as manifest:
+                if isinstance(entries := load(manifest), dict):
+                    self.entries = entries
+        except FileNotFoundError:
+            pass
+        except (OSError, UnicodeDecodeError, JSONDecodeError) as Err:
+            log.logger(
+                "e", f"{Err}. Cannot read {self.path}, converting all files."
+            )
+
+    def unchanged(
+            self, in_file: str, source: str, config: str
+        ) -> Optional[str]:
+        """Check whether the input file is unchanged since it was last
+        converted with the same config and version of simtex.
+
+        Args:
+            in_file -- path of the input file.
+            source -- hash of the input file, see source_hash.
+            config -- fingerprint of the config, see fingerprint.
+
+        Returns:
+            The path of the output, or None if the input needs to be
+            converted.
+        """
+
+        entry: Optional[dict[str, str]] = self.entries.get(abspath(in_file))
+        if (
+                entry is not None
+                and entry.get("source") == source
+                and entry.get("config") == config
+                and entry.get("version") == PkgInfo.__version__
+                and exists(output := entry.get("output", ""))
+            ):
+            return output
+
+        return None
+
+    def record(
+            self, in_file: str, source: str, config: str, output: str
+        ) -> None:
+        """Record the conversion of the input file.
+
+        Args:
+            in_file -- path of the input file.
+            source -- hash of the input file, see source_hash.
+            config -- fingerprint of the config, see fingerprint.
+            output -- path of the output file.
+        """
+
+        self.entries[abspath(in_file)] = {
+                "source": source,
+                "config": config,
+                "version": PkgInfo.__version__,
+                "output": output
+            }
+
+    def save(self) -> None:
+        """Write the manifest, replacing the previous one at once."""
+
+        tmp: str = f"{self.path}.{getpid()}-{get_ident()}"
+        try:
+            manifest: IO[Any]
+            with open(tmp, "w", encoding="utf-8") as manifest:
+                dump(self.entries, manifest, indent=4, sort_keys=True)
+            replace(tmp, self.path)
+        except OSError as Err:
+            self.log.logger(
+                "e", f"{Err}. Cannot write {self.path}, skipping ..."
+            )
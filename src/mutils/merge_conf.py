@@ -1,14 +1,14 @@
-from json import JSONDecodeError, load, dump
+from json import JSONDecodeError, load, loads, dump
 from typing import Any, TextIO
 
+from src.configs.gen.defaults import SIMTEX_JSON
 from src.utils.logger import Logger
 
 
 def merge_conf(log: Logger, CONF_PATH: str) -> None:
     """When fixing the two config files due to missing parameter, the
     other parameters should not be overwritten by the default config
-    that will be fetched from the repository, thus the two should be
-    merged instead.
+    that is bundled with simtex, thus the two should be merged instead.
 
     Args:
         log -- for logging.
@@ -20,13 +20,12 @@ def merge_conf(log: Logger, CONF_PATH: str) -> None:
         #   int, list[Any], float, dict[str, Any].
         conf: list[dict[str, Any]] = []
 
-        _new_conf: TextIO; _conf_ref: TextIO;
+        new_conf_: dict[str, Any] = loads(SIMTEX_JSON)
+
+        _conf_ref: TextIO
         with open(
-                f"{CONF_PATH}/simtex.json.bak", "r", encoding="utf-8"
-            ) as _new_conf, open(
                 f"{CONF_PATH}/simtex.json", "r", encoding="utf-8"
             ) as _conf_ref:
-            new_conf_: dict[str, Any] = load(_new_conf)
             conf_ref_: dict[str, Any] = load(_conf_ref)
 
         param: str; new_val: Any; old_conf: Any; new_conf: Any
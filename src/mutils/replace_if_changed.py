@@ -0,0 +1,23 @@
+from filecmp import cmp
+from os import remove, replace
+from os.path import exists
+
+from src.utils.logger import Logger
+
+
+def replace_if_changed(log: Logger, new_file: str, out_file: str) -> None:
+    """Move the newly written file into its place, unless the file in
+    its place has the same content, in which case it is left untouched,
+    so that its mtime does not trigger a rebuild.
+
+    Args:
+        log -- for logging.
+        new_file -- the newly written file.
+        out_file -- where the file will be placed.
+    """
+
+    if exists(out_file) and cmp(new_file, out_file, shallow=False):
+        log.logger("I", f"{out_file} is unchanged, leaving it as is ...")
+        remove(new_file)
+    else:
+        replace(new_file, out_file)
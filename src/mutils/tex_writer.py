@@ -0,0 +1,89 @@
+from io import TextIOWrapper
+from typing import IO
+
+
+class TexWriter(TextIOWrapper):
+    """Writer of the generated LaTeX file, which indents the document
+    body while it is written, instead of reading back the file after.
+
+    Every line of the document body is indented with a tab, except the
+    code blocks, which are written as is. The lines are only written
+    once they are complete, since the code blocks are found by the start
+    of their lines.
+
+    Params:
+        indent -- whether the lines are in the document body.
+        listing -- whether the lines are in a code block.
+        pending -- the incomplete line that is not yet written.
+    """
+
+    def __init__(self, out_file: str | IO[bytes]) -> None:
+        super().__init__(
+            open(out_file, "wb") if isinstance(out_file, str) else out_file,
+            encoding="utf-8"
+        )
+
+        self.indent: bool = False
+        self.listing: bool = False
+        self.pending: str = ""
+
+    def write(self, text: str) -> int:
+        """Write the text, indenting its lines if in the document body.
+
+        Args:
+            text -- the text to write.
+
+        Returns:
+            The number of characters written.
+        """
+
+        if not self.indent:
+            return super().write(text)
+
+        lines: list[str] = f"{self.pending}{text}".split("\n")
+        self.pending = lines.pop()
+
+        line: str
+        for line in lines:
+            self._write_line(f"{line}\n")
+
+        return len(text)
+
+    def _write_line(self, line: str) -> None:
+        """Write a line of the document body.
+
+        Args:
+            line -- the line to write.
+        """
+
+        if self.listing:
+            self.listing = not line.startswith(r"\end{lstlisting}")
+        elif line.startswith(r"\begin{lstlisting}"):
+            self.listing = True
+        else:
+            line = f"\t{line}"
+
+        super().write(line)
+
+    def begin_document(self, make_title: bool) -> None:
+        """Start the document body, the lines after it are indented.
+
+        Args:
+            make_title -- whether to add the title.
+        """
+
+        super().write("\n\\begin{document}\n")
+        if make_title:
+            super().write("\t\\maketitle\n")
+
+        self.indent = True
+
+    def end_document(self) -> None:
+        """End the document body, writing the last line if incomplete."""
+
+        if self.pending:
+            self._write_line(self.pending)
+            self.pending = ""
+
+        self.indent = False
+        super().write("\n\\end{document}")
@@ -1,3 +1,4 @@
+from datetime import datetime
 from difflib import SequenceMatcher as SeqMatch
 from typing import Any
 
@@ -61,7 +62,8 @@ def update_conf(
             "doc_font": args.font,
             "compiler": args.compiler,
             "encode": args.encoding,
-            "replace": args.replace
+            "replace": args.replace,
+            "profile": args.profile
         }
 
     key_: str; param: Any
@@ -76,3 +78,6 @@ def update_conf(
                 )
             )
             config.__setattr__(key_, param)
+
+    if config.date == "<NOW>":
+        config.__setattr__("date", datetime.now().strftime("%B %d, %Y"))
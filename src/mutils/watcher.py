@@ -0,0 +1,160 @@
+from ctypes import CDLL
+from ctypes.util import find_library
+from os import close, listdir, read, stat, walk
+from os.path import abspath, dirname, isdir, join
+from select import select
+from time import sleep
+from typing import Any, Optional
+
+from src.utils.logger import Logger
+
+# the events of inotify that mean that a file was written, moved, or
+# removed, see inotify(7).
+IN_CLOSE_WRITE: int = 0x00000008
+IN_MOVED_FROM: int = 0x00000040
+IN_MOVED_TO: int = 0x00000080
+IN_CREATE: int = 0x00000100
+IN_DELETE: int = 0x00000200
+IN_CLOEXEC: int = 0o2000000
+
+MASK: int = (
+        IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    )
+
+
+class Watcher:
+    """Wait for the files in the watched paths to change, using inotify
+    if it is available, and polling their mtimes otherwise.
+
+    The directories are watched instead of the files, since most editors
+    save a file by replacing it.
+
+    Params:
+        log -- for logging.
+        paths -- the watched files and directories.
+        interval -- how often the mtimes are polled, in seconds.
+        fd -- the inotify instance, None if polling.
+        state -- the mtimes of the files when they were last polled.
+    """
+
+    def __init__(
+            self, log: Logger, paths: list[str], interval: float = 0.5
+        ) -> None:
+        self.log: Logger = log
+        self.paths: list[str] = paths
+        self.interval: float = interval
+        self.fd: Optional[int] = None
+        self.watched: set[str] = set()
+
+        try:
+            self.libc: Any = CDLL(find_library("c"), use_errno=True)
+            if (fd := self.libc.inotify_init1(IN_CLOEXEC)) >= 0:
+                self.fd = fd
+        except (OSError, AttributeError):
+            pass
+
+        self.state: dict[str, tuple[int, int]] = {}
+        if self.fd is None:
+            log.logger(
+                "I", "inotify is not available, polling for changes ..."
+            )
+            self.state = self.snapshot()
+
+        self._add_watches()
+
+    def _directories(self) -> set[str]:
+        """Find the directories of the watched paths.
+
+        Returns:
+            The watched directories, and their subdirectories.
+        """
+
+        dirs: set[str] = set()
+
+        path: str
+        for path in self.paths:
+            if isdir(path):
+                dirs.update(abspath(root) for root, _, _ in walk(path))
+            else:
+                dirs.add(dirname(abspath(path)))
+
+        return dirs
+
+    def _add_watches(self) -> None:
+        """Watch the directories that are not watched yet, e.g. the ones
+        created since."""
+
+        if self.fd is None:
+            return None
+
+        directory: str
+        for directory in self._directories() - self.watched:
+            if self.libc.inotify_add_watch(
+                    self.fd, directory.encode(), MASK
+                ) >= 0:
+                self.watched.add(directory)
+
+        return None
+
+    def snapshot(self) -> dict[str, tuple[int, int]]:
+        """Stat the files in the watched directories.
+
+        Returns:
+            The mtime and size of the files, by their path.
+        """
+
+        state: dict[str, tuple[int, int]] = {}
+
+        directory: str
+        for directory in self._directories():
+            try:
+                name: str
+                for name in listdir(directory):
+                    info: Any = stat(join(directory, name))
+                    state[join(directory, name)] = (
+                            info.st_mtime_ns, info.st_size
+                        )
+            except OSError: # removed in the meantime
+                continue
+
+        return state
+
+    def wait(self, debounce: float) -> None:
+        """Block until a file changes, and then until no file changed for
+        a while, so that a burst of saves is handled once.
+
+        Args:
+            debounce -- how long the files need to stay unchanged, in
+                seconds.
+        """
+
+        if self.fd is None:
+            current: dict[str, tuple[int, int]]
+            while (current := self.snapshot()) == self.state:
+                sleep(self.interval)
+
+            while True:
+                sleep(debounce)
+                self.state = self.snapshot()
+                if self.state == current:
+                    break
+                current = self.state
+
+            return None
+
+        select([self.fd], [], [])
+        while True:
+            read(self.fd, 1 << 16) # the events are not needed
+            if not select([self.fd], [], [], debounce)[0]:
+                break
+
+        self._add_watches()
+
+        return None
+
+    def close(self) -> None:
+        """Stop watching."""
+
+        if self.fd is not None:
+            close(self.fd)
+            self.fd = None
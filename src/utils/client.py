@@ -0,0 +1,101 @@
+from json import JSONDecodeError, dumps, loads
+from os import getcwd
+from os.path import expanduser
+from socket import AF_UNIX, SHUT_WR, SOCK_STREAM, socket
+from sys import stderr
+from typing import Any, Optional
+
+# where the server listens, see simtex --serve.
+SOCKET: str = f"{expanduser('~')}/.simtex/server.sock"
+
+# the arguments that are never forwarded, since they either need the
+# terminal or are handled without the config.
+LOCAL: tuple[str, ...] = (
+        "-h", "--help", "--version", "--serve", "-w", "--watch"
+    )
+
+# how the levels of the log of the server are printed.
+LEVELS: dict[str, str] = {
+        "INFO": "\033[34mINFO\033[0m",
+        "ERROR": "\033[31mERROR\033[0m",
+        "CRITICAL": "\033[1;31mCRITICAL\033[0m"
+    }
+
+
+def forward(argv: list[str]) -> Optional[int]:
+    """Forward the arguments to the server, if one is running.
+
+    Only the conversions that assume yes are forwarded, since the server
+    cannot answer the prompts.
+
+    Args:
+        argv -- the arguments of the program.
+
+    Returns:
+        The return code of the conversion, or None if it needs to be done
+        by this process.
+    """
+
+    if any(arg in LOCAL for arg in argv) or not any(
+            arg in ("-y", "--assumeyes") for arg in argv
+        ):
+        return None
+
+    client: socket = socket(AF_UNIX, SOCK_STREAM)
+    try:
+        client.connect(SOCKET)
+    except OSError: # no server is running
+        client.close()
+        return None
+
+    chunks: list[bytes] = []
+    try:
+        client.sendall(
+            dumps({"argv": argv, "cwd": getcwd()}).encode() + b"\n"
+        )
+        client.shutdown(SHUT_WR)
+
+        while (chunk := client.recv(1 << 16)):
+            chunks.append(chunk)
+
+        response: dict[str, Any] = loads(b"".join(chunks))
+    except (OSError, JSONDecodeError) as Err:
+        print(f"{LEVELS['CRITICAL']}\t {Err}. Lost the server.", file=stderr)
+        return 1
+    finally:
+        client.close()
+
+    returncode: int = int(response.get("returncode", 1))
+    files: list[str] = response.get("files", [])
+
+    # only the errors and the summary are printed in quiet mode, as by
+    # Logger.summary.
+    quiet: bool = any(arg in ("-q", "--quiet") for arg in argv)
+    errors: int = 0
+
+    level: str; message: str
+    for level, message in response.get("log", []):
+        if level in ("ERROR", "CRITICAL"):
+            errors += 1
+        elif quiet:
+            continue
+
+        print(f"{LEVELS.get(level, level)}\t {message}", file=stderr)
+
+    if quiet:
+        print(
+            "\033[34mINFO\033[0m\t "
+            + (
+                f"{len(files)} file(s) converted, "
+                if returncode == 0 else "The conversion was aborted, "
+            )
+            + f"{errors} error(s), see "
+            f"{expanduser('~')}/.simtex/simtex.log for the details."
+        )
+    elif returncode == 0:
+        print(
+            f"\033[34mINFO\033[0m\t File(s) converted successfully and can "
+            f"be found in \033[1;36m{files}\033[0m."
+        )
+
+    return returncode
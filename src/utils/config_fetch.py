@@ -2,11 +2,13 @@ from os import mkdir
 from os.path import exists, expanduser
 from pathlib import Path
 from json import JSONDecodeError, load
+from re import error
 from typing import IO, Any, NoReturn, Optional
 
 from src.configs.config import Config
 from src.configs.rules import Rules
 from src.configs.replacements import Replacements
+from src.mutils.conf_snapshot import ConfSnapshot
 from src.mutils.fix_missing_conf import fix_missing_config
 from src.utils.logger import Logger
 
@@ -33,36 +35,41 @@ class ConfParse:
                 )
             )
 
-        paths: str
-        for paths in [self.BASE_CONF_PATH, self.CONF_PATH]:
-            if not exists(paths):
-                try:
-                    mkdir(paths)
-                except (SystemError, OSError, IOError) as Err:
-                    self.log.logger(
-                        "E", f"{Err}. Cannot create: {paths}, aborting ..."
-                    )
-                    raise SystemExit
-
         if not exists(f"{self.CONF_PATH}/simtex.json"):
+            # the directories exist if the config does.
+            paths: str
+            for paths in [self.BASE_CONF_PATH, self.CONF_PATH]:
+                if not exists(paths):
+                    try:
+                        mkdir(paths)
+                    except (SystemError, OSError, IOError) as Err:
+                        self.log.logger(
+                            "E",
+                            f"{Err}. Cannot create: {paths}, aborting ..."
+                        )
+                        raise SystemExit
+
             fix_missing_config(
                 self.log,
                 (
                     "Cannot find simtex.json in PATH"
-                    ", fetching original config  ..."
+                    ", using the default config ..."
                 ),
                 self.CONF_PATH,
-                True
+                True,
+                conf=True
             )
-        elif not exists(f"{self.CONF_PATH}/code_conf.txt"):
+
+        if not exists(f"{self.CONF_PATH}/code_conf.txt"):
             fix_missing_config(
                 self.log,
                 (
                     "Cannot find code_conf.txt in PATH"
-                    ", fetching original config  ..."
+                    ", using the default config ..."
                 ),
                 self.CONF_PATH,
-                True
+                True,
+                code_conf=True
             )
 
     def _fetch(self) -> list[dict[str, Any]] | NoReturn:
@@ -168,7 +175,18 @@ class ConfParse:
             raw_conf["ENCODE"],
             raw_conf["REPLACE"],
             raw_conf["TWOCOLS"],
-            raw_conf["ASSUME_YES"]
+            raw_conf["ASSUME_YES"],
+            # optional, since they were added later.
+            raw_conf.get(
+                "CACHE_DIR", "<HOME>/.cache/simtex"
+            ).replace(
+                "<HOME>", expanduser("~")
+            ),
+            raw_conf.get("CACHE_SIZE", 1024),
+            raw_conf.get("MAX_PASSES", 3),
+            raw_conf.get("PROFILE", "final"),
+            raw_conf.get("BLOCK_CACHE_SIZE", 64),
+            raw_conf.get("LONGTABLE_ROWS", 100)
         )
 
     def _replacements(self) -> Replacements:
@@ -196,18 +214,32 @@ class ConfParse:
             Both of the parsed data from the raw JSON config file.
         """
 
+        # parsed only if it changed since it was last parsed.
+        snapshot: ConfSnapshot = ConfSnapshot(
+                self.log, f"{self.CONF_PATH}/simtex.json"
+            )
+        if (conf := snapshot.load()) is not None:
+            return conf
+
         for _ in range(3):
+            key: Optional[tuple[Any, ...]] = snapshot.key()
             try:
                 self.raw_conf_ = self._fetch()
                 config_values: Config = self._conf()
                 rules_values: Rules = self._rules()
                 replacements: Replacements = self._replacements()
+            except error as Err:
+                self.log.logger(
+                    "E",
+                    f"{Err}. Invalid pattern in simtex.json, aborting ..."
+                )
+                raise SystemExit
             except KeyError as Err:
                 fix_missing_config(
                     self.log,
                     (
                         f"Missing {Err}. Some parameters are missing,"
-                        f" fetching the new config file from development ..."
+                        f" using the default config ..."
                     ),
                     self.CONF_PATH,
                     assume_yes,
@@ -216,6 +248,9 @@ class ConfParse:
                 )
                 continue
             else:
+                snapshot.save(
+                    key, (config_values, rules_values, replacements)
+                )
                 return config_values, rules_values, replacements
 
         self.log.logger(
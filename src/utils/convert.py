@@ -1,15 +1,73 @@
+from dataclasses import asdict
+from hashlib import sha256
 from os.path import isdir
 from subprocess import Popen
-from typing import Any, NoReturn
+from typing import Any, NoReturn, Optional
 
 from src.configs.config import Config
+from src.configs.profiles import BuildProfile, PROFILES
 from src.configs.rules import Rules
 from src.configs.replacements import Replacements
-from src.mutils.build_tex import build_file
+from src.mutils.fingerprint import fingerprint
+from src.mutils.manifest import Manifest, source_hash
 from src.utils.convert_file import convert_file
+from src.utils.convert_pool import convert_pool
 from src.mutils.find_files import find_files
 from src.utils.logger import Logger
 
+# the fields of the config that are only used by the builds, and do not
+# change the converted files.
+BUILD_FIELDS: tuple[str, ...] = (
+        "compiler",
+        "cache_dir",
+        "cache_size",
+        "max_passes",
+        "profile",
+        "block_cache_size",
+    )
+
+
+def _config_print(
+        args: Any,
+        rules: Rules,
+        config: Config,
+        replacement: Replacements
+    ) -> str:
+    """Compute the fingerprint of everything that changes the converted
+    files, other than the inputs themselves.
+
+    Args:
+        args -- overrides received from arguments.
+        rules -- rules that needs to be followed in translation.
+        config -- configuration of the document metadata, which includes,
+            formatting, packages to use among others, refer to simtex.json.
+        replacements -- math symbols that will be replaced with latex commands.
+
+    Returns:
+        The hash of the config, without the fields of the builds, of the
+        content of the code config, which is part of the preamble, and of
+        the rules and the arguments.
+    """
+
+    fields: dict[str, Any] = asdict(config)
+    for field in BUILD_FIELDS:
+        del fields[field]
+
+    code_conf: str = ""
+    try:
+        with open(config.code_conf, "rb") as conf_file:
+            code_conf = sha256(conf_file.read()).hexdigest()
+    except OSError: # reported by the conversion
+        pass
+
+    return fingerprint(
+            fields,
+            code_conf,
+            rules,
+            replacement,
+            [args.title, args.filename, args.filenametitle]
+        )
+
 
 def convert(
         log: Logger,
@@ -17,6 +75,8 @@ def convert(
         rules: Rules,
         config: Config,
         replacement: Replacements,
+        inputs: Optional[list[str]] = None,
+        cwd: Optional[str] = None
     ) -> list[str] | NoReturn:
     """Call the converter to convert the files.
 
@@ -27,15 +87,21 @@ def convert(
         config -- configuration of the document metadata, which includes,
             formatting, packages to use among others, refer to simtex.json.
         replacements -- math symbols that will be replaced with latex commands.
-        input_file -- the directory of the input file.
+        inputs -- the files to convert, e.g. the ones that changed, all
+            the files in the input if None.
+        cwd -- where the compiler is run, e.g. the directory of the client
+            of the server, the current directory if None.
 
     Returns:
         The path(s) of the converted file.
     """
 
     file_path: list[str] = []
+    files: list[str] = [args.input]
 
-    if isdir(args.input):
+    if inputs is not None:
+        files = inputs
+    elif isdir(args.input):
         log.logger(
             "I",
             (
@@ -44,52 +110,170 @@ def convert(
                 f" with: {rules.files} to LaTeX ..."
             )
         )
-        files: list[str] = find_files(args.input, rules.files)
+        files = find_files(args.input, rules.compiled.files)
 
-        cur: int; file: str
-        for cur, file in enumerate(files):
-            log.logger(
-                "I", f"Converting the {cur} in directory: {args.input}"
-            )
-            file_path.append(
-                convert_file(
+    # the inputs that did not change since they were last converted with
+    # the same config are skipped.
+    manifest: Manifest = Manifest(log, config.output_folder)
+    config_print: str = _config_print(args, rules, config, replacement)
+
+    sources: dict[str, str] = {}
+    outputs: dict[str, str] = {}
+
+    file: str
+    for file in files:
+        try:
+            sources[file] = source_hash(file)
+        except OSError:
+            continue # reported by the conversion
+
+        if (output := manifest.unchanged(
+                file, sources[file], config_print
+            )) is not None:
+            outputs[file] = output
+
+    if outputs:
+        log.logger(
+            "I", f"Skipping {len(outputs)} unchanged file(s) ..."
+        )
+
+    pending: list[str] = [file for file in files if file not in outputs]
+    converted: dict[str, Optional[str]] = {}
+
+    try:
+        if isdir(args.input):
+            jobs: int = args.jobs if args.jobs is not None else 1
+            if jobs > 1 and not args.assumeyes:
+                log.logger(
+                    "e",
+                    "Prompts cannot be answered in parallel, use -y to"
+                    " convert with multiple jobs, converting sequentially ..."
+                )
+                jobs = 1
+
+            cur: int
+            if jobs > 1 and len(pending) > 1:
+                converted.update(
+                    zip(
+                        pending,
+                        convert_pool(
+                            log,
+                            args,
+                            rules,
+                            config,
+                            replacement,
+                            pending,
+                            jobs
+                        )
+                    )
+                )
+            else:
+                for cur, file in enumerate(pending):
+                    log.logger(
+                        "I",
+                        f"Converting the {cur} in directory: {args.input}"
+                    )
+                    converted[file] = convert_file(
+                            log,
+                            args,
+                            rules,
+                            config,
+                            replacement,
+                            file
+                        )
+        elif pending:
+            converted[args.input] = convert_file(
                     log,
                     args,
                     rules,
                     config,
                     replacement,
-                    file
+                    args.input
                 )
-            )
-    else:
-        file_path.append(
-            convert_file(
-                log,
-                args,
-                rules,
-                config,
-                replacement,
-                args.input
-            )
+    finally:
+        # the files that were converted are recorded, even if the rest
+        # were aborted.
+        for file, output in converted.items():
+            if output is not None and file in sources:
+                manifest.record(file, sources[file], config_print, output)
+
+        if converted:
+            manifest.save()
+
+    if (failed := [
+            file for file, output in converted.items() if output is None
+        ]):
+        log.logger(
+            "E", f"Cannot convert: {', '.join(failed)}, aborting ..."
         )
+        raise SystemExit
+
+    outputs.update(
+        (file, output)
+        for file, output in converted.items() if output is not None
+    )
+
+    file_path.extend(outputs[file] for file in files)
 
     if args.build:
-        for file in file_path:
-            build_file(
+        # imported here, since the builds start threads and processes,
+        # and are not needed by the conversions alone.
+        from src.mutils.artifact_store import ArtifactStore
+        from src.mutils.build_tex import BuildJob, build_files
+
+        profile: BuildProfile = PROFILES.get(
+                config.profile, PROFILES["final"]
+            )
+        if config.profile not in PROFILES:
+            log.logger(
+                "e",
+                (
+                    f"Unknown build profile: {config.profile}, "
+                    "using final ..."
+                )
+            )
+
+        builds: list[BuildJob] = build_files(
                 log,
                 config.compiler,
                 config.output_folder,
-                file,
-                args.verbose
+                file_path,
+                args.verbose,
+                args.jobs if args.jobs is not None else 1,
+                ArtifactStore(
+                    log,
+                    f"{config.cache_dir}/builds",
+                    config.cache_size*1024*1024
+                ) if config.cache_size > 0 else None,
+                config.max_passes,
+                profile,
+                f"{config.cache_dir}/formats",
+                cwd
             )
-            if args.buildnview:
+
+        build: BuildJob
+        for build in builds:
+            if args.buildnview and build.returncode == 0:
                 try:
-                    Popen(["xgd-open", file])
+                    Popen(["xgd-open", build.filename])
                 except FileNotFoundError:
                     log.logger(
                         "e", "No PDF viewer found, cannot view PDF file."
                     )
-    else:
+
+        if (failed := [
+                build.filename for build in builds if build.returncode != 0
+            ]):
+            log.logger(
+                "E", f"Cannot build: {', '.join(failed)}."
+            )
+            if not args.quiet:
+                print(
+                    "\033[34mINFO\033[0m\t Try updating "
+                    "the compiler parameter in simtex.json"
+                )
+            raise SystemExit
+    elif not args.quiet:
         print(
             "\033[34mINFO \033[0m\t To compile the output, you "
             "use can overleaf: \033[36mhttps://www.overleaf.com/"
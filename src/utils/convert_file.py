@@ -1,13 +1,19 @@
-from typing import Any, TextIO, NoReturn
+from os import getpid, remove
+from os.path import exists
+from threading import get_ident
+from typing import Any, NoReturn, Optional
 
 from src.configs.config import Config
 from src.configs.rules import Rules
 from src.configs.replacements import Replacements
 from src.utils.tex.parser.headings import headings
-from src.utils.tex.parser.body import body
-from src.mutils.format_body import format_body
+from src.utils.tex.parser.body import body, read_lines
+from src.mutils.block_cache import BlockCache
 from src.mutils.fix_file_path import fix_file_path
 from src.mutils.fix_title import fix_title
+from src.mutils.longtable_rows import longtable_rows
+from src.mutils.replace_if_changed import replace_if_changed
+from src.mutils.tex_writer import TexWriter
 from src.mutils.finalize import finalize
 from src.utils.logger import Logger
 
@@ -54,24 +60,54 @@ def convert_file(
             args.assumeyes
         )
 
+    # written beside the output first, and then moved into its place
+    # only if the content changed.
+    TMP_PATH: str = f"{OFILE_PATH}.{getpid()}-{get_ident()}.tmp"
+
+    long_rows: int = longtable_rows(config)
+    cache: Optional[BlockCache] = BlockCache(
+            log,
+            f"{config.cache_dir}/blocks.sqlite",
+            config.block_cache_size*1024*1024,
+            rules,
+            replacement,
+            config.replace,
+            long_rows
+        ) if config.block_cache_size > 0 else None
+
     try:
-        out_file: TextIO
-        with open(OFILE_PATH, "w", encoding="utf-8") as out_file:
-            start: int = headings(log, config, title, out_file)
+        out_file: TexWriter
+        with TexWriter(TMP_PATH) as out_file:
+            headings(log, config, title, out_file)
+            out_file.begin_document(config.make_title)
             files: list[str] = body(
                     log,
                     rules,
                     replacement,
                     config.replace,
-                    input_file,
-                    out_file
+                    read_lines(input_file),
+                    out_file,
+                    cache,
+                    long_rows
                 )
-        format_body(log, config, start, OFILE_PATH)
+            out_file.end_document()
+        replace_if_changed(log, TMP_PATH, OFILE_PATH)
         finalize(log, files, config.output_folder, input_file)
-    except (IOError, PermissionError) as Err:
+    except (IOError, PermissionError, UnicodeDecodeError) as Err:
         log.logger(
             "E", f"{Err}. Cannot convert the file to LaTeX, aborting ..."
         )
         raise SystemExit
+    finally:
+        # left behind if the conversion was aborted, e.g. by an input
+        # that is not UTF-8.
+        if exists(TMP_PATH):
+            try:
+                remove(TMP_PATH)
+            except OSError:
+                pass
+
+        if cache is not None:
+            cache.close()
 
     return OFILE_PATH
@@ -0,0 +1,156 @@
+from logging.handlers import QueueListener
+from os.path import getsize
+from signal import signal, SIGINT, SIG_IGN
+from typing import Any, Callable, Optional
+
+from src.configs.config import Config
+from src.configs.rules import Rules
+from src.configs.replacements import Replacements
+from src.mutils.chunk_size import chunk_size
+from src.utils.convert_file import convert_file
+from src.utils.logger import Logger
+
+# shared state of the worker, set once by the initializer instead of
+# being pickled along with every file.
+_STATE: Optional[tuple[Logger, Any, Rules, Config, Replacements]] = None
+
+
+def _init_worker(
+        log: Logger,
+        queue: Any,
+        args: Any,
+        rules: Rules,
+        config: Config,
+        replacement: Replacements
+    ) -> None:
+    """Initialize the worker process of the pool.
+
+    Args:
+        log -- for logging.
+        queue -- where the records are sent to the parent, see
+            Logger.forward.
+        args -- overrides received from arguments.
+        rules -- rules that needs to be followed in translation.
+        config -- configuration of the document metadata, which includes,
+            formatting, packages to use among others, refer to simtex.json.
+        replacement -- math symbols that will be replaced with latex commands.
+    """
+
+    global _STATE
+
+    log.forward(queue)
+
+    # the parent handles the interrupt and terminates the pool.
+    signal(SIGINT, SIG_IGN)
+    _STATE = (log, args, rules, config, replacement)
+
+
+def _convert_worker(job: tuple[int, str]) -> tuple[int, Optional[str]]:
+    """Convert a single file inside the worker process.
+
+    Args:
+        job -- the index of the file and its path.
+
+    Returns:
+        The index of the file and the path of its output, or None if the
+        conversion was aborted.
+    """
+
+    if _STATE is None: # not started by convert_pool
+        raise RuntimeError("The worker of the pool is not initialized.")
+
+    index: int; file: str
+    index, file = job
+
+    try:
+        return index, convert_file(*_STATE, file)
+    except SystemExit:
+        # SystemExit is not propagated by the pool, and would leave the
+        # parent waiting for the result indefinitely.
+        return index, None
+    except Exception as Err: # e.g. an input that is not UTF-8
+        _STATE[0].logger(
+            "e", f"{Err!r}. Cannot convert {file}, skipping ..."
+        )
+        return index, None
+
+
+def convert_pool(
+        log: Logger,
+        args: Any,
+        rules: Rules,
+        config: Config,
+        replacement: Replacements,
+        files: list[str],
+        jobs: int
+    ) -> list[Optional[str]]:
+    """Convert the files in parallel using a pool of processes.
+
+    Args:
+        log -- for logging.
+        args -- overrides received from arguments.
+        rules -- rules that needs to be followed in translation.
+        config -- configuration of the document metadata, which includes,
+            formatting, packages to use among others, refer to simtex.json.
+        replacement -- math symbols that will be replaced with latex commands.
+        files -- the files to convert.
+        jobs -- number of processes to use.
+
+    Returns:
+        The path(s) of the converted file, in the same order as the input,
+        or None for the files whose conversion was aborted.
+    """
+
+    size: Callable[
+            [tuple[int, str]], int
+        ] = lambda job: getsize(job[1])
+    try:
+        # larger files are dispatched first, so that they do not end up
+        # as the last running task of the pool.
+        pending: list[tuple[int, str]] = sorted(
+                enumerate(files), key=size, reverse=True
+            )
+    except OSError:
+        pending = list(enumerate(files))
+
+    chunks: int = chunk_size(files, jobs)
+    log.logger(
+        "I",
+        f"Converting {len(files)} files with {jobs} jobs"
+        f" (chunk size: {chunks}) ..."
+    )
+
+    outputs: list[Optional[str]] = [None for _ in files]
+
+    # imported here, since it is slow to import, and only needed by the
+    # conversions of directories with multiple jobs.
+    from multiprocessing import Pool, Queue
+
+    # the records of the workers are handled by the parent.
+    queue: Any = Queue()
+    listener: QueueListener = log.listen(queue)
+
+    pool = Pool(
+            jobs,
+            initializer=_init_worker,
+            initargs=(log, queue, args, rules, config, replacement)
+        )
+    done: bool = False
+    try:
+        index: int; output: Optional[str]
+        for index, output in pool.imap_unordered(
+                _convert_worker, pending, chunksize=chunks
+            ):
+            outputs[index] = output
+        done = True
+    finally:
+        # the workers are stopped at once if the conversion did not
+        # finish, e.g. on an interrupt.
+        if done:
+            pool.close()
+        else:
+            pool.terminate()
+        pool.join()
+        listener.stop()
+
+    return outputs
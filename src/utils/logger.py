@@ -1,47 +1,162 @@
 import logging
+from atexit import register
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from os import mkdir
+from os import getpid, mkdir
 from os.path import exists
+from queue import SimpleQueue
+from typing import Any, Optional
 
-from rich.logging import RichHandler
+# the size of the log file before it is rotated, and the number of the
+# rotated files that are kept.
+LOG_SIZE: int = 4*1024*1024
+LOG_BACKUPS: int = 3
+
+
+class _Errors(logging.Handler):
+    """Collect the messages of the errors that are logged by the
+    processes of the pool, for the summary.
+
+    Params:
+        errors -- where the messages are collected.
+    """
+
+    def __init__(self, errors: list[str]) -> None:
+        super().__init__(logging.ERROR)
+        self.errors: list[str] = errors
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.errors.append(record.getMessage())
 
 
 class Logger:
-    """Custom logger."""
-
-    def __init__(self) -> None:
-        logging.basicConfig(
-            format="%(message)s",
-            level=logging.INFO,
-            datefmt="[%X]",
-            handlers=[
-                    RichHandler(
-                        show_time=False,
-                        show_path=False
-                    )
-                ]
-        )
+    """Custom logger.
+
+    The records are written to the log file by a background thread, so
+    that the conversion never waits for the disk, while they are printed
+    in the terminal right away, to stay in order with the prompts. In
+    quiet mode, they are not printed at all. The processes of the pool
+    send their records to the parent, see forward. A silent logger, e.g.
+    the one of the library, only keeps the errors.
+
+    Params:
+        quiet -- whether to print only the errors, in the summary, instead
+            of every record.
+        silent -- whether to neither print nor write the records, which
+            are sent to a logger of its own, so that the logger of the
+            program is left as is.
+        errors -- the messages of the errors, for the summary.
+    """
+
+    def __init__(self, quiet: bool = False, silent: bool = False) -> None:
+        self.quiet: bool = quiet or silent
+        self.silent: bool = silent
+        self.errors: list[str] = []
+        self.pid: int = getpid()
+        self.handlers: list[logging.Handler] = []
+        self.running: bool = False
+
+        if silent:
+            self.log: logging.Logger = logging.Logger("simtex.silent")
+            self.log.addHandler(logging.NullHandler())
+            return None
+
+        # imported here, since rich is slow to import, and is not needed
+        # by the paths that do not log, e.g. --version.
+        from rich.logging import RichHandler
 
-        self.log: logging.Logger = logging.getLogger("rich")
+        console: list[logging.Handler] = []
+        if not quiet:
+            console.append(RichHandler(show_time=False, show_path=False))
+            console[0].setFormatter(
+                logging.Formatter("%(message)s", "[%X]")
+            )
+
+        self.log = logging.getLogger("rich")
+        self.log.setLevel(logging.INFO)
+        self.log.propagate = False
+
+        queue: SimpleQueue[Any] = SimpleQueue()
+        self.log.handlers = [*console, QueueHandler(queue)]
+        self.handlers = console.copy()
 
+        failure: str = ""
         BASE_PATH: Path = Path.home()/".simtex"
-        if not exists(BASE_PATH):
-            try:
+        try:
+            if not exists(BASE_PATH):
                 mkdir(BASE_PATH)
-            except (PermissionError, OSError, IOError) as Err:
-                self.logger(
-                    "E", f"Cannot create directory: {Err}, aborting ..."
+
+            file_log: logging.Handler = RotatingFileHandler(
+                    filename=f"{BASE_PATH}/simtex.log",
+                    maxBytes=LOG_SIZE,
+                    backupCount=LOG_BACKUPS
                 )
+            file_log.setLevel(logging.INFO)
+            file_log.setFormatter(
+                logging.Formatter("%(levelname)s %(message)s")
+            )
+            self.handlers.append(file_log)
+        except (PermissionError, OSError, IOError) as Err:
+            failure = f"Cannot create the log file: {Err}, skipping ..."
 
-        file_log: logging.FileHandler = logging.FileHandler(
-                filename=f"{BASE_PATH}/simtex.log"
+        self.listener: QueueListener = QueueListener(
+                queue, *self.handlers[len(console):]
             )
+        self.listener.start()
+        self.running = True
+        register(self.close)
 
-        file_log.setLevel(logging.INFO)
-        file_log.setFormatter(
-            logging.Formatter("%(levelname)s %(message)s")
-        )
-        self.log.addHandler(file_log)
+        if failure:
+            self.logger("e", failure)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle the logger as a new one, for the processes of the pool
+        that are spawned instead of forked."""
+
+        return (Logger, (self.quiet, self.silent))
+
+    def listen(self, queue: Any) -> QueueListener:
+        """Handle the records of the processes of the pool, which are sent
+        through the queue, as the records of this process, see forward.
+
+        Args:
+            queue -- the queue shared with the processes of the pool.
+
+        Returns:
+            The running listener, which is stopped once the pool is.
+        """
+
+        listener: QueueListener = QueueListener(
+                queue,
+                *self.handlers,
+                _Errors(self.errors),
+                respect_handler_level=True
+            )
+        listener.start()
+
+        return listener
+
+    def forward(self, queue: Any) -> None:
+        """Send the records to the parent process, instead of handling
+        them, in the processes of the pool, so that the log file is only
+        written and rotated by the parent, and the errors are in its
+        summary.
+
+        Args:
+            queue -- the queue shared with the parent, see listen.
+        """
+
+        self.log.handlers = [QueueHandler(queue)]
+        self.pid = getpid()
+        self.running = False # the listener is in the parent
+
+    def close(self) -> None:
+        """Stop the background thread, once the queued records are
+        handled."""
+
+        if self.running and getpid() == self.pid:
+            self.listener.stop()
+            self.running = False
 
     def logger(self, exception_: str, message: str) -> None:
         """Log the proccesses using passed message and exception_ variable.
@@ -54,7 +169,33 @@ class Logger:
         match exception_:
             case "E": # for major error
                 self.log.critical("%s" % (message))
+                self.errors.append(message)
             case "e":
                 self.log.error("%s" % (message))
+                self.errors.append(message)
             case "I": # to print information in the terminal
                 self.log.info("%s" % (message))
+
+    def summary(self, files: Optional[int]) -> None:
+        """Print the summary of the batch, in quiet mode.
+
+        Args:
+            files -- the number of files that were converted, None if the
+                conversion was aborted.
+        """
+
+        self.close() # the log is complete before the summary
+
+        message: str
+        for message in self.errors:
+            print(f"\033[31mERROR\033[0m\t {message}")
+
+        print(
+            "\033[34mINFO\033[0m\t "
+            + (
+                f"{files} file(s) converted, "
+                if files is not None else "The conversion was aborted, "
+            )
+            + f"{len(self.errors)} error(s), see "
+            f"{Path.home()/'.simtex'/'simtex.log'} for the details."
+        )
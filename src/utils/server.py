@@ -0,0 +1,241 @@
+import logging
+from argparse import ArgumentError, ArgumentParser
+from copy import deepcopy
+from json import JSONDecodeError, dumps, loads
+from os import chmod, remove, stat
+from os.path import join, normpath
+from socket import AF_UNIX, SOCK_STREAM, socket
+from socketserver import StreamRequestHandler, ThreadingUnixStreamServer
+from threading import Lock, get_ident
+from typing import Any, NoReturn
+
+from src.configs.config import Config
+from src.configs.rules import Rules
+from src.configs.replacements import Replacements
+from src.mutils.update_conf import update_conf
+from src.utils.client import SOCKET
+from src.utils.config_fetch import ConfParse
+from src.utils.convert import convert
+from src.utils.logger import Logger
+
+
+class _Capture(logging.Handler):
+    """Collect the log of the request that is handled by this thread, so
+    that it is sent back to the client.
+
+    Params:
+        thread -- the thread that handles the request.
+        records -- the level and message of each record.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(logging.INFO)
+        self.thread: int = get_ident()
+        self.records: list[tuple[str, str]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.thread == self.thread:
+            self.records.append((record.levelname, record.getMessage()))
+
+
+class _Parser(ArgumentParser):
+    """Parser of the arguments of the clients, whose errors are raised
+    instead of printed, so that they are sent back to the client."""
+
+    def error(self, message: str) -> NoReturn:
+        raise ArgumentError(
+            None, f"{self.format_usage()}{self.prog}: error: {message}"
+        )
+
+
+class Server(ThreadingUnixStreamServer):
+    """Server that converts and builds the files that the clients send,
+    with the config loaded only once, each request in its own thread.
+
+    The config is loaded again once simtex.json is changed.
+
+    Params:
+        log -- for logging.
+        parser -- the parser of the arguments of the clients, which has
+            the arguments of the program.
+        conf_parse -- the parser of the config.
+        conf -- the config, the rules and the replacements.
+        mtime -- the mtime of simtex.json when it was loaded.
+    """
+
+    daemon_threads: bool = True
+
+    def __init__(
+            self,
+            log: Logger,
+            parser: ArgumentParser,
+            conf_parse: ConfParse,
+            conf: tuple[Config, Rules, Replacements]
+        ) -> None:
+        self.log: Logger = log
+        self.parser: ArgumentParser = _Parser(
+                prog=parser.prog,
+                usage=parser.usage,
+                description=parser.description,
+                parents=[parser],
+                add_help=False
+            )
+        self.conf_parse: ConfParse = conf_parse
+        self.conf: tuple[Config, Rules, Replacements] = conf
+        self.mtime: int = self._mtime()
+        self.lock: Lock = Lock()
+
+        super().__init__(SOCKET, _Handler)
+        chmod(SOCKET, 0o600) # only the user can convert
+
+    def _mtime(self) -> int:
+        """Stat the config file.
+
+        Returns:
+            The mtime of simtex.json.
+        """
+
+        try:
+            return stat(f"{self.conf_parse.CONF_PATH}/simtex.json").st_mtime_ns
+        except OSError:
+            return 0
+
+    def _config(self) -> tuple[Config, Rules, Replacements]:
+        """Load the config again, if it changed since it was loaded.
+
+        Returns:
+            The config, the rules and the replacements.
+        """
+
+        with self.lock:
+            if (mtime := self._mtime()) != self.mtime:
+                self.log.logger("I", "The config changed, reloading it ...")
+                self.conf = self.conf_parse.fetched_conf(True)
+                self.mtime = mtime
+
+            return self.conf
+
+    def convert(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Convert the files of the request.
+
+        Args:
+            request -- the arguments and the working directory of the
+                client.
+
+        Returns:
+            The return code, the converted files and the log of the
+            conversion.
+        """
+
+        capture: _Capture = _Capture()
+        self.log.log.addHandler(capture)
+
+        returncode: int = 0
+        files: list[str] = []
+        try:
+            args: Any = self.parser.parse_args(request["argv"])
+            args.assumeyes = True # there is no one to answer the prompts
+
+            if args.input is None:
+                self.parser.error("the input file or directory is required")
+
+            rules: Rules; replacement: Replacements; config: Config
+            config, rules, replacement = self._config()
+            config = deepcopy(config) # the overrides are per request
+
+            update_conf(self.log, config, args, True)
+
+            # the paths are relative to the client.
+            cwd: str = request["cwd"]
+            args.input = normpath(join(cwd, args.input))
+            args.outputfolder = normpath(join(cwd, args.outputfolder))
+            config.output_folder = args.outputfolder
+
+            files = convert(
+                    self.log, args, rules, config, replacement, cwd=cwd
+                )
+        except SystemExit: # already logged
+            returncode = 1
+        except ArgumentError as Err:
+            self.log.logger("E", str(Err))
+            returncode = 1
+        except (KeyError, TypeError) as Err:
+            self.log.logger("e", f"Invalid request: {Err}.")
+            returncode = 1
+        except Exception as Err: # the client waits for an answer
+            self.log.logger(
+                "e", f"{Err!r}. Cannot handle the request, skipping ..."
+            )
+            returncode = 1
+        finally:
+            self.log.log.removeHandler(capture)
+            # the errors are sent back to the client, and are not kept
+            # for the lifetime of the server.
+            self.log.errors.clear()
+
+        return {
+                "returncode": returncode,
+                "files": files,
+                "log": capture.records
+            }
+
+
+class _Handler(StreamRequestHandler):
+    """Handle a request, which is a line of json, and answer with a line
+    of json."""
+
+    server: Server
+
+    def handle(self) -> None:
+        try:
+            request: Any = loads(self.rfile.readline())
+        except (UnicodeDecodeError, JSONDecodeError):
+            return None
+
+        if not isinstance(request, dict):
+            return None
+
+        self.wfile.write(
+            dumps(self.server.convert(request)).encode() + b"\n"
+        )
+
+        return None
+
+
+def serve(
+        log: Logger,
+        parser: ArgumentParser,
+        conf_parse: ConfParse,
+        conf: tuple[Config, Rules, Replacements]
+    ) -> None:
+    """Serve the conversions, until interrupted.
+
+    Args:
+        log -- for logging.
+        parser -- the parser of the arguments of the program.
+        conf_parse -- the parser of the config.
+        conf -- the config, the rules and the replacements.
+    """
+
+    probe: socket = socket(AF_UNIX, SOCK_STREAM)
+    try:
+        probe.connect(SOCKET)
+    except FileNotFoundError:
+        pass
+    except OSError: # left by a server that did not stop cleanly
+        remove(SOCKET)
+    else:
+        log.logger("E", f"A server is already running at {SOCKET}.")
+        raise SystemExit
+    finally:
+        probe.close()
+
+    server: Server
+    with Server(log, parser, conf_parse, conf) as server:
+        log.logger("I", f"Serving at {SOCKET}, press Ctrl+C to stop ...")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            log.logger("I", "Stopped serving.")
+        finally:
+            remove(SOCKET)
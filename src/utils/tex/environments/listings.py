@@ -1,24 +1,17 @@
 from typing import TextIO
 
+from src.utils.tex.parser.blocks import Code
 
-def listings(
-        rule: str,
-        line: str,
-        start: int,
-        source: list[str],
-        out_file: TextIO
-    ) -> int:
+
+def listings(block: Code, out_file: TextIO) -> None:
     """For formatting of code blocks.
 
     Args:
-        rule -- rule that needs to be followed in translation.
-        line -- line that will be analyzed and translated.
-        start -- where the parser/translator would start.
-        source -- where the other lines of equation would be found.
+        block -- the code block that will be translated.
         out_file -- where the translated line will be written.
     """
 
-    language: str = line.removeprefix("```").replace("\n", "").title()
+    language: str = block.line.removeprefix("```").replace("\n", "").title()
     if language:
         out_file.write(
             "\n\\begin{lstlisting}"
@@ -29,12 +22,11 @@ def listings(
             "\n\\begin{lstlisting}\n"
         )
 
-    code: str; cur: int
-    for cur, code in enumerate(source[start+1:]):
-        if code.strip() == rule:
-            out_file.write("\end{lstlisting}\n")
-            break
-
+    code: str
+    for code in block.code:
         out_file.write(code)
 
-    return cur+start+1
+    if block.closed:
+        out_file.write("\end{lstlisting}\n")
+
+    return None
@@ -1,44 +1,30 @@
 from typing import TextIO
 
+from src.utils.tex.parser.blocks import Align, Equation
 
-def mathsec(
-        rule: str,
-        line: str,
-        source: list[str],
-        start: int,
-        out_file: TextIO,
-    ) -> int:
+
+def mathsec(rule: str, block: Equation | Align, out_file: TextIO) -> None:
     """Handles the math found in the input, this includes paragraph math
     inline math, and aligned paragraph math.
 
     Arguments:
         rule -- rule that needs to be followed in translation.
-        line -- line that will be analyzed and translated.
+        block -- the equation or align that will be translated.
         out_file -- where the translated line will be written.
-        source -- where the other lines of equation would be found.
-        start -- where the parser/translator would start.
-        ignore -- for knowing what line(s) to skip.
-
-    Returns:
-        An integer that denotes what line to skip.
     """
 
     maths: list[str] = []
 
-    if line.strip() == rule or line.strip() in [f"{rule}--", f"{rule} --"]: # for align
-        if line.strip().endswith("--"):
+    if isinstance(block, Align): # for align
+        if block.marker.endswith("--"):
             align_env: str = "align*"
         else:
             align_env = "align"
 
         out_file.write(f"\n\\begin{{{align_env}}}\n")
 
-        eq: str; cur: int
-        for cur, eq in enumerate(source[start+1:]):
-            if eq.strip() == rule:
-                end = cur+1+start
-                break
-
+        eq: str
+        for eq in block.equations:
             eq = eq.replace("\n", "").strip()
             if "&" not in eq:
                 if "=" in eq and "\\text{" not in eq:
@@ -73,13 +59,12 @@ def mathsec(
 
         out_file.write(f"\\end{{{align_env}}}\n")
     else:
-        end = start+1
         out_file.write(
             (
                 "\n\\begin{equation}\n"
-                f"\t{line.replace(rule, '')}\n"
+                f"\t{block.line.replace(rule, '')}\n"
                 "\\end{equation}\n"
             )
         )
 
-    return end
+    return None
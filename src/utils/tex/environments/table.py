@@ -1,76 +1,139 @@
-from collections import Counter
+from re import compile, sub, Pattern
 from typing import TextIO
 
 from src.configs.rules import Rules
 from src.configs.replacements import Replacements
+from src.utils.tex.parser.blocks import Table
 from src.utils.tex.text.format import format
-from src.utils.tex.parser.table_parse import table_parse
+
+# a cell of the separator row, whose colons tell the alignment.
+RULE: Pattern[str] = compile(r":?-+:?")
+
+
+def _cells(row: str) -> list[str]:
+    """Split the row of the table into its cells.
+
+    Args:
+        row -- the row as it is in the markdown.
+
+    Returns:
+        The cells of the row, not yet formatted.
+    """
+
+    return (
+            row.replace("\n", "").strip()
+                .removesuffix("|")
+                .removeprefix("|")
+                .split("|")
+        )
+
+
+def _align(cell: str) -> str:
+    """Translate the cell of the separator row to its alignment.
+
+    Args:
+        cell -- the cell of the separator row, e.g. :---:.
+
+    Returns:
+        The column type, the columns are centered unless aligned.
+    """
+
+    if cell.startswith(":") and not cell.endswith(":"):
+        return "l"
+    if cell.endswith(":") and not cell.startswith(":"):
+        return "r"
+
+    return "c"
 
 
 def table(
         rules: Rules,
         replacements: Replacements,
-        start: int,
+        block: Table,
         replace_math_symb: bool,
-        source: list[str],
+        long_rows: int,
         out_file: TextIO
-    ) -> int:
+    ) -> None:
     """Write the parsed table to the body of the LaTeX file.
 
+    Each row is split into its cells once, and the cells are formatted
+    one at a time, the rows that are only dashes are written as a rule.
+    A table with more data rows than long_rows is written as a longtable,
+    which is broken across the pages, and repeats its header on them.
+
     Args:
         rules: Rules -- rules that needs to be followed in translation.
         replacements -- math symbols that will be replaced with latex commands.
-        start -- where the parser/translator would start.
+        block -- the table that will be translated.
         replace_math_symb -- whether to replace the math symbols.
-        source -- where the other rows would be found.
+        long_rows -- the number of rows after which the table is written
+            as a longtable, 0 to never use it.
         out_file -- where the translated line will be written.
-
-    Returns:
-        An integer that denotes what line to skip.
     """
 
-    out_file.write("\n\\begin{center}\n")
-
-    cur: int; row: str
-    for cur, row in enumerate(source[start:]):
-        row = row.replace("\n", "").strip()
-
-        if row.strip() in ["\n", ""]:
-            end: int = cur+start
-            break
-
-        parsed: str | tuple[
-                int, list[str], str
-            ] = table_parse(
-                cur,
-                format(
-                    rules,
-                    replacements,
-                    row,
-                    row.split("|"),
-                    replace_math_symb
-                )
-            )
+    rows: list[list[str]] = [_cells(row) for row in block.rows]
+    rules_: list[bool] = [
+            cur > 0 and all(RULE.fullmatch(cell.strip()) for cell in row)
+            for cur, row in enumerate(rows)
+        ]
 
-        if isinstance(parsed, tuple):
-            cols: str = " | ".join(["c" for _ in parsed[1]])
-            line: str = (
-                    f"\t\\begin{{tabular}}{{| {cols} |}}"
-                    f"\t\t\\hline\n\t\t{parsed[2]} \\\\"
-                )
-        elif isinstance(parsed, str):
-            if parsed == r"\hline":
-                line = f"\n\t\t{parsed}"
+    # the first row is the header, if the separator row follows it.
+    header: bool = len(rows) > 1 and rules_[1]
+
+    aligns: list[str] = []
+    if header:
+        aligns = [_align(cell.strip()) for cell in rows[1]]
+
+    cols: str = " | ".join(
+            aligns[cur] if cur < len(aligns) else "c"
+            for cur in range(len(rows[0]))
+        )
+
+    data: int = rules_.count(False) - header # without the header and rules
+    longtable: bool = 0 < long_rows < data
+    if longtable:
+        out_file.write(f"\n\\begin{{longtable}}{{| {cols} |}}\n\t\\hline\n")
+    else:
+        out_file.write(
+            f"\n\\begin{{center}}\n\t\\begin{{tabular}}{{| {cols} |}}"
+            "\t\t\\hline"
+        )
+
+    head: bool = longtable # whether the header is not yet ended
+
+    cur: int; row: list[str]
+    for cur, row in enumerate(rows):
+        if rules_[cur]:
+            if longtable:
+                out_file.write("\t\\hline\n")
+                if head:
+                    out_file.write("\t\\endhead\n")
+                    head = False
             else:
-                line = f"\n\t\t{parsed} \\\\"
+                out_file.write("\n\t\t\\hline")
+            continue
+
+        line: str = sub(
+                " +",
+                " ",
+                " & ".join(
+                    format(rules, replacements, cell, replace_math_symb)
+                    for cell in row
+                )
+            ).strip()
 
-        out_file.write(line)
+        if longtable:
+            out_file.write(f"\t{line} \\\\\n")
+        else:
+            out_file.write(f"\n\t\t{line} \\\\")
 
-    out_file.write(
-        (
+    if longtable:
+        out_file.write("\t\\hline\n\\end{longtable}\n")
+    else:
+        out_file.write(
             "\t\t\\hline\n\t"
             "\\end{tabular}\n"
             "\\end{center}\n"
         )
-    )
-    return end
+
+    return None
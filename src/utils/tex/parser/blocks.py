@@ -0,0 +1,183 @@
+from typing import Any, ClassVar
+
+
+class Block:
+    """Block of the parsed document, which keeps the markdown of the
+    block as is, thus it is rendered with the config and rules given to
+    the renderer, and not the ones it was parsed with.
+
+    The blocks are converted to lists of their kind and fields, and back,
+    see dump and load, thus a parsed document can be stored as json.
+    """
+
+    __slots__: tuple[str, ...] = ()
+    KIND: ClassVar[str] = ""
+
+    def __init__(self, *values: Any) -> None:
+        name: str; value: Any
+        for name, value in zip(self.__slots__, values, strict=True):
+            setattr(self, name, value)
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and dump([self]) == dump([other])
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}{tuple(dump([self])[0][1:])}"
+
+
+class Heading(Block):
+    """A heading, i.e. a section down to a subparagraph.
+
+    Params:
+        symbol -- the marker of the heading, which tells whether it is
+            numbered and centered.
+        command -- the sectioning command, e.g. section.
+        line -- the line of the heading.
+    """
+
+    __slots__ = ("symbol", "command", "line")
+    KIND = "heading"
+
+    symbol: str
+    command: str
+    line: str
+
+
+class Paragraph(Block):
+    """A line of text, which is formatted inline.
+
+    Params:
+        line -- the line of the paragraph.
+        wrap -- whether the paragraph is separated by empty lines.
+    """
+
+    __slots__ = ("line", "wrap")
+    KIND = "paragraph"
+
+    line: str
+    wrap: bool
+
+
+class Equation(Block):
+    """An equation on a line of its own, written as an equation.
+
+    Params:
+        line -- the line of the equation, with its markers.
+    """
+
+    __slots__ = ("line",)
+    KIND = "equation"
+
+    line: str
+
+
+class Align(Block):
+    """The equations between the align markers, written as an align.
+
+    Params:
+        marker -- the marker that opened the align, which tells whether
+            it is numbered.
+        equations -- the lines of the equations.
+    """
+
+    __slots__ = ("marker", "equations")
+    KIND = "align"
+
+    marker: str
+    equations: list[str]
+
+
+class Code(Block):
+    """A code block, which is written as a listing.
+
+    Params:
+        line -- the line that opened the code block, with its language.
+        code -- the lines of the code.
+        closed -- whether the code block is closed before the end of the
+            file.
+    """
+
+    __slots__ = ("line", "code", "closed")
+    KIND = "code"
+
+    line: str
+    code: list[str]
+    closed: bool
+
+
+class Quote(Block):
+    """A block quote, which is written as a displayquote.
+
+    Params:
+        lines -- the lines of the block quote, with their markers.
+    """
+
+    __slots__ = ("lines",)
+    KIND = "quote"
+
+    lines: list[str]
+
+
+class Table(Block):
+    """A table, which is written as a tabular or a longtable.
+
+    Params:
+        rows -- the rows of the table, from the header up to the empty
+            line that ends it.
+    """
+
+    __slots__ = ("rows",)
+    KIND = "table"
+
+    rows: list[str]
+
+
+class Figure(Block):
+    """An image with its caption, which is written as a figure.
+
+    Params:
+        caption -- the caption of the figure.
+        path -- the path of the image, as it is in the markdown.
+    """
+
+    __slots__ = ("caption", "path")
+    KIND = "figure"
+
+    caption: str
+    path: str
+
+
+KINDS: dict[str, type[Block]] = {
+        block.KIND: block for block in (
+            Heading, Paragraph, Equation, Align, Code, Quote, Table, Figure
+        )
+    }
+
+
+def dump(blocks: list[Block]) -> list[list[Any]]:
+    """Convert the blocks to lists, which can be stored as json.
+
+    Args:
+        blocks -- the parsed document.
+
+    Returns:
+        The kind and fields of every block.
+    """
+
+    return [
+            [block.KIND, *(getattr(block, name) for name in block.__slots__)]
+            for block in blocks
+        ]
+
+
+def load(data: list[list[Any]]) -> list[Block]:
+    """Convert the lists back to blocks, see dump.
+
+    Args:
+        data -- the kind and fields of every block.
+
+    Returns:
+        The parsed document.
+    """
+
+    return [KINDS[kind](*values) for kind, *values in data]
@@ -1,156 +1,206 @@
-from re import sub
-from typing import Callable, TextIO
+from io import StringIO
+from typing import Iterable, Iterator, Optional, TextIO
 
 from src.configs.rules import Rules
 from src.configs.replacements import Replacements
-from src.mutils.check_if_table import check_if_table
+from src.mutils.block_cache import BlockCache
 from src.utils.tex.environments.table import table
 from src.utils.tex.environments.mathsec import mathsec
 from src.utils.tex.environments.figure import figure
 from src.utils.tex.environments.quotes import quotation
 from src.utils.tex.environments.listings import listings
+from src.utils.tex.parser.blocks import (
+    Align, Block, Code, Equation, Figure, Heading, Paragraph, Quote, Table
+)
+from src.utils.tex.parser.parse import parse
 from src.utils.tex.text.format import format
 from src.utils.logger import Logger
 
 
-def body(
-        log: Logger,
+def read_lines(in_file: str) -> Iterator[str]:
+    """Read the lines of the input file one at a time, instead of loading
+    the whole file.
+
+    Args:
+        in_file -- path of the file to be converted to LaTeX.
+
+    Yields:
+        The lines of the input file.
+    """
+
+    ref_file: TextIO
+    with open(in_file, "r", encoding="utf-8") as ref_file:
+        yield from ref_file
+
+
+def _heading(block: Heading) -> str:
+    """Translate the heading to its sectioning command.
+
+    Args:
+        block -- the heading.
+
+    Returns:
+        The sectioning command.
+    """
+
+    title: str = block.line.replace(block.symbol, "").replace("\n", "").strip()
+    centering: str = r"\centering" if "c" in block.symbol else ""
+
+    return (
+            f"\n\\{block.command}"
+            f"{'*' if block.symbol.endswith('*') else ''}"
+            r"{"
+            f"{title}"
+            f"{centering}"
+            r"}"
+            "\n"
+        )
+
+
+def _block(
         rules: Rules,
         replacements: Replacements,
         replace_math_symb: bool,
-        in_file: str,
-        out_file: TextIO
-    ) -> list[str]:
-    """Generate a LaTeX version of the given markdown file.
+        block: Block,
+        long_rows: int
+    ) -> str:
+    """Translate the block to LaTeX.
 
     Args:
-        log -- for logging.
         rules -- rules that needs to be followed in translation.
         replacements -- math symbols that will be replaced with latex commands.
         replace_math_symb -- whether to replace the math symbols.
-        in_file -- path of the file to be converted to LaTeX.
-        out_file -- where the translated line will be written.
+        block -- the block to be translated.
+        long_rows -- the number of rows after which a table is written as
+            a longtable, 0 to never use it.
 
     Returns:
-        A list of files found in the input file.
+        The LaTeX of the block.
     """
 
-    log.logger("I", "Writing the body to the document ...")
-
-    files: list[str] = []
-    ignore: int = -1
-    centering: str = r"\centering"
+    out_file: StringIO = StringIO()
 
     line: str
-    striptitle: Callable[
-            [str, str], str
-        ] = lambda line, symbol: (
-            (
-                line
-                    .replace(symbol, "")
-                    .replace("\n", "")
-                    .strip()
+    match block:
+        case Heading():
+            line = _heading(block)
+        case Paragraph():
+            line = f"\n{block.line}\n" if block.wrap else block.line
+        case Equation() | Align():
+            mathsec(rules.paragraph_math, block, out_file)
+            return out_file.getvalue()
+        case Quote():
+            quotation(rules, replacements, block, replace_math_symb, out_file)
+            return out_file.getvalue()
+        case Code():
+            listings(block, out_file)
+            return out_file.getvalue()
+        case Table():
+            table(
+                rules,
+                replacements,
+                block,
+                replace_math_symb,
+                long_rows,
+                out_file
             )
-        )
-    section: Callable[
-            [str, str, str], str
-        ] = lambda symbol, line, command: (
-            f"\n\\{command}"
-            f"{'*' if symbol.endswith('*') else ''}"
-            r"{"
-            f"{striptitle(line, symbol)}"
-            f"{centering if 'c' in symbol else ''}"
-            r"}"
-            "\n"
-        )
+            return out_file.getvalue()
+        case Figure():
+            figure(block, out_file)
+            return out_file.getvalue()
 
-    ref_file: TextIO
-    with open(in_file, "r", encoding="utf-8") as ref_file:
-        ref_tex: list[str] = ref_file.readlines()
+    return format(rules, replacements, line, replace_math_symb)
 
-    ref_tex.append("\n")
 
-    cur: int # current index
-    for cur, line in enumerate(ref_tex):
-        if line in ["", "\n"] or cur <= ignore:
-            continue
+def render(
+        rules: Rules,
+        replacements: Replacements,
+        replace_math_symb: bool,
+        blocks: Iterable[Block],
+        out_file: TextIO,
+        cache: Optional[BlockCache] = None,
+        long_rows: int = 0
+    ) -> list[str]:
+    """Write the LaTeX of the parsed document.
 
-        # replace numerous \n, if there is any, with one \n
-        line = sub(r"\n{2, 10}", "\n", line).strip()
-        symbol: str = line.split()[0].strip()
-
-        match symbol.replace("c", ""):
-            case rules.section | rules.sectionn:
-                line = section(symbol, line, "section")
-            case rules.subsection | rules.subsectionn:
-                line = section(symbol, line, "subsection")
-            case rules.subsubsection | rules.subsubsectionn:
-                line = section(symbol, line, "subsubsection")
-            case rules.paragraph | rules.paragraphn:
-                line = section(symbol, line, "paragraph")
-            case rules.subparagraph | rules.subparagraphn:
-                line = section(symbol, line, "subparagraph")
-            case _:
-                if line.startswith(rules.paragraph_math): # math mode
-                    ignore = mathsec(
-                            rules.paragraph_math,
-                            line,
-                            ref_tex,
-                            cur,
-                            out_file
-                        )
-                    continue
-                elif line.startswith(rules.bquote):
-                    ignore = quotation(
-                            rules,
-                            replacements,
-                            ref_tex,
-                            cur,
-                            replace_math_symb,
-                            out_file
-                        )
-                    continue
-                elif line.startswith(rules.code): # for code blocks
-                    ignore = listings(
-                            rules.code,
-                            line,
-                            cur,
-                            ref_tex,
-                            out_file
-                        )
-                    continue
-                else:
-                    skip_line: bool = figure(
-                            rules.image,
-                            line,
-                            files,
-                            out_file
-                        )
-                    if not skip_line:
-                        try:
-                            if check_if_table(ref_tex[cur], ref_tex[cur+1]):
-                                ignore = table(
-                                        rules,
-                                        replacements,
-                                        cur,
-                                        replace_math_symb,
-                                        ref_tex,
-                                        out_file
-                                    )
-                                continue
-                            else:
-                                line = f"\n{line}\n"
-                        except IndexError:
-                            pass
-
-        out_file.write(
-            format(
-                rules,
-                replacements,
-                line,
-                line.split(),
-                replace_math_symb
+    Args:
+        rules -- rules that needs to be followed in translation.
+        replacements -- math symbols that will be replaced with latex commands.
+        replace_math_symb -- whether to replace the math symbols.
+        blocks -- the parsed document, see parse.
+        out_file -- where the translated line will be written.
+        cache -- the blocks that were rendered before with the same rules,
+            which are reused instead of being rendered again.
+        long_rows -- the number of rows after which a table is written as
+            a longtable, 0 to never use it.
+
+    Returns:
+        A list of files referenced in the document.
+    """
+
+    files: list[str] = []
+
+    block: Block
+    for block in blocks:
+        if isinstance(block, Figure):
+            files.append(block.path)
+
+        if cache is None:
+            out_file.write(
+                _block(
+                    rules, replacements, replace_math_symb, block, long_rows
+                )
             )
-        )
+            continue
+
+        key: str = cache.key(block)
+        latex: Optional[str]
+        if (latex := cache.get(key)) is None:
+            latex = _block(
+                    rules, replacements, replace_math_symb, block, long_rows
+                )
+            cache.put(key, latex)
+
+        out_file.write(latex)
 
     return files
+
+
+def body(
+        log: Logger,
+        rules: Rules,
+        replacements: Replacements,
+        replace_math_symb: bool,
+        lines: Iterable[str],
+        out_file: TextIO,
+        cache: Optional[BlockCache] = None,
+        long_rows: int = 0
+    ) -> list[str]:
+    """Generate a LaTeX version of the given markdown file, the blocks
+    are rendered as they are parsed.
+
+    Args:
+        log -- for logging.
+        rules -- rules that needs to be followed in translation.
+        replacements -- math symbols that will be replaced with latex commands.
+        replace_math_symb -- whether to replace the math symbols.
+        lines -- the lines to be converted to LaTeX, see read_lines.
+        out_file -- where the translated line will be written.
+        cache -- the blocks that were rendered before, see render.
+        long_rows -- see render.
+
+    Returns:
+        A list of files found in the input file.
+    """
+
+    log.logger("I", "Writing the body to the document ...")
+
+    return render(
+            rules,
+            replacements,
+            replace_math_symb,
+            parse(rules, lines),
+            out_file,
+            cache,
+            long_rows
+        )
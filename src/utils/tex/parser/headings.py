@@ -1,30 +1,55 @@
-from datetime import datetime
-from typing import IO, Any, TextIO
+from dataclasses import asdict
+from os import stat
+from typing import IO, Any, Optional, TextIO
 
 from src.configs.config import Config
+from src.configs.formats import ENDOFDUMP
+from src.mutils.fingerprint import fingerprint
 from src.utils.logger import Logger
 
+# the rendered preambles, keyed by the fingerprint of the config and the
+# mtime of the code config, since they are the same for every document
+# converted with the same config.
+PREAMBLES: dict[tuple[str, int], str] = {}
 
-def headings(
-        log: Logger,
-        config: Config,
-        title: str,
-        out_file: TextIO
-    ) -> int:
-    """Create the headings of the LaTeX file.
+
+def _fingerprint(config: Config) -> tuple[str, int]:
+    """Compute the key of the preamble of the config.
+
+    Args:
+        config -- configuration of the document metadata, which includes,
+            formatting, packages to use among others, refer to simtex.json.
+
+    Returns:
+        The hash of the config, without the author and date, since they
+        are not part of the preamble, and the mtime of the code config,
+        or -1 if it cannot be read.
+    """
+
+    fields: dict[str, Any] = asdict(config)
+    del fields["author"], fields["date"]
+
+    try:
+        mtime: int = stat(config.code_conf).st_mtime_ns
+    except OSError:
+        mtime = -1
+
+    return fingerprint(fields), mtime
+
+
+def _preamble(log: Logger, config: Config) -> str:
+    """Render the preamble of the LaTeX file, which includes everything
+    in the headings, except the title, author and date.
 
     Args:
         log -- for logging.
         config -- configuration of the document metadata, which includes,
             formatting, packages to use among others, refer to simtex.json.
-        title -- title of the document.
-        out_file -- where the translated line will be written.
 
     Returns:
-        The number of lines used by the headings.
+        The preamble.
     """
 
-    CONST: int = 12
     sections: dict[str, str] = {
             "main": (
                     "\n%\ size config of sections"
@@ -56,9 +81,6 @@ def headings(
             )
         ]
 
-    if config.date == "<NOW>":
-        config.__setattr__("date", datetime.now().strftime("%B %d, %Y"))
-
     pkgs_: str | list[str]
     for pkgs_ in config.packages:
         if isinstance(pkgs_, list):
@@ -106,9 +128,7 @@ def headings(
     for sec_sizes, sec_val in zip(
             config.section_sizes.values(), sections.values()
         ):
-        if str(sec_sizes) == "<DEF>":
-            CONST -= 1
-        else:
+        if str(sec_sizes) != "<DEF>":
             headings.append(
                 sec_val.replace(
                     "<SECTION_SIZES>",
@@ -145,21 +165,63 @@ def headings(
             "e", f"{Err}. Cannot read code config file, skipping ..."
         )
 
-    headings.extend(
-        [
-            (
-                "\n% paper info\n"
-                f"\\title{{{title}}}"
-            ),
-            f"\\author{{{config.author}}}",
-            f"\date{{{config.date}}}"
-        ]
-    )
+    return "".join(f"{items}\n" for items in headings)
+
+
+def preamble(log: Logger, config: Config) -> str:
+    """Fetch the preamble of the config, it is rendered once for every
+    config, and reused for the other documents converted with it.
+
+    Args:
+        log -- for logging.
+        config -- configuration of the document metadata, which includes,
+            formatting, packages to use among others, refer to simtex.json.
+
+    Returns:
+        The preamble.
+    """
+
+    key: tuple[str, int] = _fingerprint(config)
+    if (rendered := PREAMBLES.get(key)) is None:
+        rendered = PREAMBLES[key] = _preamble(log, config)
+
+    return rendered
+
+
+def headings(
+        log: Logger,
+        config: Config,
+        title: str,
+        out_file: TextIO,
+        rendered: Optional[str] = None
+    ) -> None:
+    """Create the headings of the LaTeX file.
+
+    Args:
+        log -- for logging.
+        config -- configuration of the document metadata, which includes,
+            formatting, packages to use among others, refer to simtex.json.
+        title -- title of the document.
+        out_file -- where the translated line will be written.
+        rendered -- the preamble of the config, see preamble, it is
+            fetched if None.
+    """
+
+    if rendered is None:
+        rendered = preamble(log, config)
 
     try:
         log.logger("I", "Writing headings to file ...")
-        for items in headings:
-            out_file.write(f"{items}\n")
+        out_file.write(rendered)
+        out_file.write(
+            # end of the precompiled preamble, see build_tex, this is a
+            # no-op if the document is built without the format.
+            f"{ENDOFDUMP}\n"
+            "\n% paper info\n"
+            f"\\title{{{title}}}\n"
+            f"\\author{{{config.author}}}\n"
+            f"\\date{{{config.date}}}\n"
+        )
     except (
         IOError,
         SystemError,
@@ -171,4 +233,4 @@ def headings(
         )
         raise SystemExit
 
-    return len(headings)+CONST # 11 is the number of newlines created.
+    return None
@@ -0,0 +1,101 @@
+from itertools import chain
+from re import sub
+from typing import Iterable, Iterator
+
+from src.configs.rules import Rules
+from src.mutils.check_if_table import check_if_table
+from src.mutils.line_cursor import LineCursor
+from src.utils.tex.parser.blocks import (
+    Align, Block, Code, Equation, Figure, Heading, Paragraph, Quote, Table
+)
+
+
+def _until(source: LineCursor, end: str) -> tuple[list[str], bool]:
+    """Consume the lines of an environment, up to its end.
+
+    Args:
+        source -- the lines after the start of the environment.
+        end -- the marker of the end of the environment.
+
+    Returns:
+        The lines of the environment, and whether its end was found.
+    """
+
+    lines: list[str] = []
+
+    line: str
+    for line in source:
+        if line.strip() == end:
+            return lines, True
+
+        lines.append(line)
+
+    return lines, False
+
+
+def parse(rules: Rules, lines: Iterable[str]) -> Iterator[Block]:
+    """Parse the markdown into blocks, see blocks, the lines are read
+    only as the blocks are needed.
+
+    Args:
+        rules -- rules that needs to be followed in parsing.
+        lines -- the lines of the markdown.
+
+    Yields:
+        The blocks of the document.
+    """
+
+    # followed by an empty line that ends the last block.
+    source: LineCursor = LineCursor(chain(lines, ["\n"]))
+
+    raw: str # the line as is in the input file
+    for raw in source:
+        if not raw.strip():
+            continue
+
+        # replace numerous \n, if there is any, with one \n
+        line: str = sub(r"\n{2, 10}", "\n", raw).strip()
+        symbol: str = line.split()[0].strip()
+
+        match symbol.replace("c", ""):
+            case rules.section | rules.sectionn:
+                yield Heading(symbol, "section", line)
+            case rules.subsection | rules.subsectionn:
+                yield Heading(symbol, "subsection", line)
+            case rules.subsubsection | rules.subsubsectionn:
+                yield Heading(symbol, "subsubsection", line)
+            case rules.paragraph | rules.paragraphn:
+                yield Heading(symbol, "paragraph", line)
+            case rules.subparagraph | rules.subparagraphn:
+                yield Heading(symbol, "subparagraph", line)
+            case _ if line.startswith(rules.paragraph_math): # math mode
+                if line.strip() in rules.compiled.align:
+                    yield Align(
+                        line.strip(),
+                        _until(source, rules.paragraph_math)[0]
+                    )
+                else:
+                    yield Equation(line)
+            case _ if line.startswith(rules.bquote):
+                quote: list[str] = [raw]
+                while (
+                        (after := source.peek()) is not None
+                        and after.startswith(rules.bquote)
+                    ):
+                    quote.append(next(source))
+
+                yield Quote(quote)
+            case _ if line.startswith(rules.code): # for code blocks
+                yield Code(line, *_until(source, rules.code))
+            case _:
+                img: list[tuple[str, str]]
+                if (img := rules.compiled.image.findall(line)):
+                    yield Figure(img[0][0], img[0][1])
+                    # the line of the image is also written as is.
+                    yield Paragraph(line, False)
+                elif (after := source.peek()) is not None and check_if_table(
+                        raw, after
+                    ):
+                    yield Table([raw, *_until(source, "")[0]])
+                else:
+                    yield Paragraph(line, after is not None)
@@ -1,91 +1,173 @@
-from re import findall
-from typing import Callable
+from re import Match, Pattern
+from typing import Optional
 
-from src.configs.rules import Rules
+from src.configs.rules import Marker, Rules
 from src.configs.replacements import Replacements
-from src.mutils.check_if_eq import check_if_eq
 from src.utils.tex.text.replace_util import replace_symb
+from src.utils.tex.text.spans import CODE, LINK, MATH, TEXT, Span, segment
 
+# LaTeX command of the inline rules that are wrapped with a command.
+COMMANDS: dict[str, str] = {
+        "bold": "textbf",
+        "italics": "textit",
+        "emph": "emph",
+        "strike": "sout",
+        "supscript": "textsuperscript",
+        "subscript": "textsubscript",
+        "uline": "underline"
+    }
 
-def format(
+# the spans that are not text are replaced by a character of the private
+# use plane while the text is formatted, so the markers are never
+# searched inside of them.
+PLACEHOLDER: int = 0xF0000
+
+
+def _scan(
+        markers: dict[str, list[Marker]],
+        line: str,
+        start: int,
+        end: int
+    ) -> str:
+    """Translate the markers of line[start:end] in one left to right scan.
+
+    The closing marker of each kind is searched at most once for every
+    position it is found in, thus the scan is O(n * m), where n is the
+    length of the line and m is the number of markers, and the content of
+    the formatting is scanned again only once per level of nesting.
+
+    Args:
+        markers -- the inline markers, indexed by their first character.
+        line -- line that needs to be translated.
+        start, end -- the part of the line that will be translated.
+
+    Returns:
+        The translated part of the line.
+    """
+
+    out: list[str] = []
+    closing: dict[str, int] = {} # next position of each closing marker
+    text: int = start # start of the text that is not yet written
+
+    cur: int = start
+    while cur < end:
+        token: Optional[Match[str]] = None
+
+        marker: str; pattern: Pattern[str]; name: str
+        for marker, pattern, name in markers.get(line[cur], []):
+            if not line.startswith(marker, cur):
+                continue
+
+            close: int = closing.get(marker, -2)
+            if close != -1 and close < cur+len(marker):
+                close = line.find(marker, cur+len(marker), end)
+                closing[marker] = close
+
+            if close != -1 and (
+                    token := pattern.fullmatch(line, cur, close+len(marker))
+                ) is not None:
+                break
+
+        if token is None:
+            cur += 1
+            continue
+
+        out.append(line[text:cur].replace("_", r"\_"))
+
+        inner: str = _scan(markers, line, *token.span(1))
+        if name == "quote":
+            out.append(f"``{inner}''")
+        else:
+            out.append(f"\\{COMMANDS[name]}{{{inner}}}")
+
+        cur = text = token.end()
+
+    out.append(line[text:end].replace("_", r"\_"))
+
+    return "".join(out)
+
+
+def _render(
         rules: Rules,
         replacements: Replacements,
         line: str,
-        words: list[str],
         replace_math_symb: bool
     ) -> str:
-    """Formats the text in a line.
+    """Translate each of the spans of the line by its kind.
 
-    Arguments:
-        line -- line that needs to be translated.
-        replacements -- math symbols that will be replaced with latex commands.
-        words -- list of words in the line split by spaces.
+    Args:
         rules -- rules that needs to be followed in translation.
+        replacements -- math symbols that will be replaced with latex commands.
+        line -- line that needs to be translated.
         replace_math_symb -- whether to replace the math symbols.
 
     Returns:
-        The formatted line.
+        The translated line.
     """
 
-    rule: str; line_: str; phrase: str; command: str
-    rparse: Callable[
-            [str, str, str, str], str
-        ] = lambda rule, line_, phrase, command: (
-            line_.replace(
-                    f"{rule}{phrase}{rule}",
-                    f"\\{command}{{{phrase}}}"
-                )
-        )
-
-    inline_maths_: list[str] = findall(rules.inline_math[1], line)
-    inline_maths: list[str] = []
-    for eq_ in inline_maths_:
-        if isinstance(eqs := eq_.split(), list):
-            for eq in eqs:
-                inline_maths.append(eq)
-        else:
-            inline_maths.append(eq_)
+    spans: list[Span] = segment(rules, line)
+    if len(spans) == 1 and spans[0].kind == TEXT:
+        return _scan(rules.compiled.markers, line, 0, len(line))
 
-    inline_maths_.clear()
+    masked: list[str] = []
+    rendered: dict[int, str] = {}
 
-    for word in words:
-        if (quotes := findall(rules.quote[1], line)):
-            line = line.replace(
-                    f"{rules.quote[0]}{quotes[0]}{rules.quote[0]}",
-                    f"``{quotes[0]}''"
-                )
-        elif (bold := findall(rules.bold[1], line)):
-            line = rparse(rules.bold[0], line, bold[0], "textbf")
-        elif (italics := findall(rules.italics[1], line)):
-            line = rparse(rules.italics[0], line, italics[0], "textit")
-        elif (emph := findall(rules.emph[1], line)):
-            line = rparse(rules.emph[0], line, emph[0], "emph")
-        elif (strike := findall(rules.strike[1], line)):
-            line = rparse(rules.strike[0], line, strike[0], "sout")
-        elif (supscript := findall(rules.supscript[1], line)):
-            line = rparse(
-                    rules.supscript[0], line, supscript[0], "textsuperscript"
-                )
-        elif (subscript := findall(rules.subscript[1], line)):
-            line = rparse(
-                    rules.subscript[0], line, subscript[0], "textsubscript"
+    span: Span
+    for span in spans:
+        if span.kind == TEXT:
+            masked.append(span.text)
+            continue
+
+        placeholder: int = PLACEHOLDER+len(rendered)
+        masked.append(chr(placeholder))
+
+        if span.kind == MATH: # only the math symbols are replaced
+            rendered[placeholder] = (
+                    replace_symb(
+                        span.text, rules.inline_math[0], replacements
+                    )
+                    if replace_math_symb else span.text
                 )
-        elif (uline := findall(rules.uline[1], line)):
-            line = rparse(rules.uline[0], line, uline[0], "underline")
-        elif (link := findall(rules.links, line)):
-            line = line.replace(
-                    f"[{link[0][0]}]({link[0][1]})",
-                    f"\\href{{{link[0][1]}}}{{{link[0][0]}}}"
+        elif span.kind == CODE: # inline code is not formatted
+            code: str = span.text.replace("_", r"\_")
+            rendered[placeholder] = f"\\texttt{{{code}}}"
+        elif span.kind == LINK:
+            inner: str = _render(
+                    rules, replacements, span.text, replace_math_symb
                 )
-        elif (icodes := findall(rules.inline_code[1], line)):
-            if icodes[0] == "":
-                continue
-            line = rparse(rules.inline_code[0], line, icodes[0], "texttt")
+            rendered[placeholder] = f"\\href{{{span.target}}}{{{inner}}}"
+
+    text: str = "".join(masked)
+
+    return _scan(
+            rules.compiled.markers, text, 0, len(text)
+        ).translate(rendered)
+
+
+def format(
+        rules: Rules,
+        replacements: Replacements,
+        line: str,
+        replace_math_symb: bool
+    ) -> str:
+    """Formats the text in a line.
 
-        if not check_if_eq(rules.inline_math[0], word, inline_maths):
-            line = line.replace(word, word.replace("_", r"\_"))
+    The line is split once into text, inline math, inline code and links,
+    then the markers of the text are translated in a single scan, refer to
+    _scan for the cost of the translation. The underscores are escaped
+    only in the text and the inline code, and the math symbols are
+    replaced only in the inline math.
 
-        if replace_math_symb:
-            line = replace_symb(line, word, rules, replacements)
+    Arguments:
+        line -- line that needs to be translated.
+        replacements -- math symbols that will be replaced with latex commands.
+        rules -- rules that needs to be followed in translation.
+        replace_math_symb -- whether to replace the math symbols.
+
+    Returns:
+        The formatted line.
+    """
 
-    return line.replace("LaTeX", r"\LaTeX{}").replace("%", r"\%")
+    return _render(
+            rules, replacements, line, replace_math_symb
+        ).replace("LaTeX", r"\LaTeX{}").replace("%", r"\%")
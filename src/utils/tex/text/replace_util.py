@@ -1,43 +1,34 @@
-from re import findall
+from re import Match, compile, Pattern
 
 from src.configs.replacements import Replacements
-from src.configs.rules import Rules
 
+# a symbol that may be replaced, the symbols are separated by whitespace.
+SYMBOL: Pattern[str] = compile(r"\S+")
 
-def replace_symb(
-        line: str,
-        word: str,
-        rules: Rules,
-        replacements: Replacements
-    ) -> str:
+
+def replace_symb(math: str, marker: str, replacements: Replacements) -> str:
     """Replace a UTF or ascii string with their respective LaTeX command.
 
+    Only the whole tokens are replaced, i.e. the symbols separated from
+    the rest of the math by whitespace, thus `|>` is not replaced inside
+    of `|x|>0`, each token is looked up once in the replacements.
+
     Args:
-        line -- line where there might be a character or string to replace.
-        word -- word to match with the string or character in replacement.
-        rules -- rules that needs to be followed in translation.
+        math -- the inline math, including its markers.
+        marker -- the marker of the inline math.
         replacements -- math symbols that will be replaced with latex commands.
 
     Returns:
-        The line with replaced character and strings.
+        The inline math with replaced character and strings.
     """
 
-    math_symb: str
-    if (
-            (
-                math_symb := word.replace(
-                        rules.inline_math[0], ""
-                    )
-            ) in replacements.replacements.keys()
-        ):
-        line = line.replace(
-                word,
-                replacements.replacements.get(
-                    math_symb, word
-                )
-            )
-
-        if math_symb in findall(rules.inline_math[1], line)[0]:
-            line = f"${line}$"
-
-    return line
+    symbols: dict[str, str] = replacements.replacements
+
+    def replace(symbol: Match[str]) -> str:
+        """Replace the symbol, if it is defined."""
+
+        return symbols.get(symbol.group(0), symbol.group(0))
+
+    inner: str = math.removeprefix(marker).removesuffix(marker)
+
+    return f"{marker}{SYMBOL.sub(replace, inner)}{marker}"
@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from re import Match, Pattern
+from typing import Optional
+
+from src.configs.rules import Rules
+
+# kinds of the spans of a line.
+TEXT: str = "text"
+MATH: str = "math"
+CODE: str = "code"
+LINK: str = "link"
+
+
+@dataclass(frozen=True, slots=True)
+class Span:
+    """A part of the line with a single kind of content.
+
+    Params:
+        kind -- the kind of the span, either text, math, code or link.
+        text -- the content of the span, for math this includes the
+            markers, and for links this is the text of the link.
+        target -- the target of the link.
+    """
+
+    kind: str
+    text: str
+    target: str = ""
+
+
+def segment(rules: Rules, line: str) -> list[Span]:
+    """Split the line into text, inline math, inline code and links.
+
+    This is done in one left to right scan, in which the closing marker of
+    the math and code is searched at most once for every position it is
+    found in, thus the cost is linear to the length of the line.
+
+    Args:
+        rules -- rules that needs to be followed in translation.
+        line -- line that will be split.
+
+    Returns:
+        The spans of the line, in order.
+    """
+
+    spans: list[Span] = []
+    delimited: list[tuple[str, str, Pattern[str]]] = [
+            (rules.inline_code[0], CODE, rules.compiled.inline_code),
+            (rules.inline_math[0], MATH, rules.compiled.inline_math)
+        ]
+    closing: dict[str, int] = {} # next position of each closing marker
+    text: int = 0 # start of the text that is not yet a span
+
+    cur: int = 0
+    while cur < len(line):
+        token: Optional[Match[str]] = None
+        kind: str = TEXT
+
+        if line[cur] == "[":
+            token = rules.compiled.links.match(line, cur)
+            kind = LINK
+        else:
+            marker: str; pattern: Pattern[str]
+            for marker, kind, pattern in delimited:
+                if not marker or not line.startswith(marker, cur):
+                    continue
+
+                close: int = closing.get(marker, -2)
+                if close != -1 and close < cur+len(marker):
+                    close = line.find(marker, cur+len(marker))
+                    closing[marker] = close
+
+                if close != -1:
+                    token = pattern.fullmatch(line, cur, close+len(marker))
+
+                if token is not None and (kind == MATH or token.group(1)):
+                    break # empty inline code is left as text
+                token = None
+
+        if token is None:
+            cur += 1
+            continue
+
+        if cur > text:
+            spans.append(Span(TEXT, line[text:cur]))
+
+        if kind == LINK:
+            spans.append(Span(LINK, token.group(1), token.group(2)))
+        elif kind == CODE:
+            spans.append(Span(CODE, token.group(1)))
+        else:
+            spans.append(Span(MATH, token.group(0)))
+
+        cur = text = token.end()
+
+    if text < len(line):
+        spans.append(Span(TEXT, line[text:]))
+
+    return spans
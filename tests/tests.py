@@ -1,11 +1,67 @@
+import sys
 import unittest
-from os.path import expanduser
+from argparse import Namespace
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import replace
+from logging.handlers import BufferingHandler
+from io import StringIO
+from os import chmod, environ, listdir, remove, utime
+from os.path import exists, expanduser, isdir
+from tempfile import TemporaryDirectory
+from threading import Thread, Timer
+from time import monotonic
+from unittest.mock import patch
 
+from src.api import convert_text, convert_texts
+from src.cli import Cli
 from src.configs.config import Config
+from src.configs.formats import ENDOFDUMP
+from src.configs.gen.defaults import CODE_CONF, SIMTEX_JSON
+from src.configs.profiles import PROFILES
 from src.configs.rules import Rules
+from src.mutils.block_cache import BlockCache
 from src.configs.replacements import Replacements
+from src.mutils.artifact_store import ArtifactStore
+from src.mutils.chunk_size import chunk_size
+from src.mutils.build_tex import (
+        _compile, _dump_format, _format_name, _tex_version, build_files
+    )
+from src.mutils.conf_snapshot import ConfSnapshot
+from src.mutils.manifest import Manifest, source_hash
+from src.mutils.watcher import Watcher
+from src.utils.client import forward
 from src.utils.config_fetch import ConfParse
+from src.utils.convert import _config_print
+from src.utils.convert_file import convert_file
+from src.utils.convert_pool import convert_pool
 from src.utils.logger import Logger
+from src.utils.server import Server
+from src.utils.tex.parser.blocks import Code, Heading, dump, load
+from src.utils.tex.parser.body import render
+from src.utils.tex.parser.headings import PREAMBLES, _preamble, preamble
+from src.utils.tex.parser.parse import parse
+from src.utils.tex.text.format import format
+
+
+# compiler that records its passes, d for a draft and x for a full one,
+# its aux file stops changing once it has run as many times as the
+# number of the file name.
+FAKE_COMPILER: str = f"""#!{sys.executable}
+import sys
+out = [arg for arg in sys.argv if arg.startswith("-output-directory=")]
+name = sys.argv[-1].rsplit("/", 1)[-1].removesuffix(".tex")
+base = out[0].split("=", 1)[1] + "/" + name
+draft = "-draftmode" in sys.argv
+with open(base + ".passes", "a") as passes:
+    passes.write("d" if draft else "x")
+with open(base + ".passes") as passes:
+    count = len(passes.read())
+with open(base + ".aux", "w") as aux:
+    aux.write(str(min(count, int(name.split("-")[-1]))))
+if not draft:
+    with open(base + ".pdf", "w") as pdf:
+        pdf.write("pdf")
+"""
 
 
 class TestCases(unittest.TestCase):
@@ -48,6 +104,7 @@ class TestCases(unittest.TestCase):
                     "xcolor",
                     "listings",
                     "caption",
+                    "longtable",
                     "csquotes",
                     [
                         "ulem",
@@ -159,3 +216,734 @@ class TestCases(unittest.TestCase):
             ),
             self.replacement
         )
+
+    def test_defaults(self) -> None:
+        """Test case for the bundled default config."""
+
+        name: str; bundled: str
+        for name, bundled in [
+                ("simtex.json", SIMTEX_JSON), ("code_conf.txt", CODE_CONF)
+            ]:
+            with open(
+                    f"./examples/config/{name}", "r", encoding="utf-8"
+                ) as example:
+                self.assertEqual(example.read(), bundled)
+
+    def test_convert_text(self) -> None:
+        """Test case for the library interface."""
+
+        document = convert_text(
+                "# Title\n\nSome **text**.\n\n![cap](./a.png)\n",
+                self.config,
+                self.rules,
+                self.replacement,
+                title="A_b"
+            )
+        self.assertIn(r"\title{A\_b}", document.latex)
+        self.assertIn(r"\section{Title}", document.latex)
+        self.assertIn(r"Some \textbf{text}.", document.latex)
+        self.assertEqual(document.assets, ["./a.png"])
+
+    def test_convert_texts(self) -> None:
+        """Test case for the library interface with many documents, which
+        share the preamble and leave the logger of the program as is."""
+
+        handlers = self.log.log.handlers
+        documents = convert_texts(
+                ["# A\n\nFirst.\n", ("B", "# B\n\nSecond.\n")],
+                self.config,
+                self.rules,
+                self.replacement
+            )
+
+        self.assertEqual(len(documents), 2)
+        self.assertIn("First.", documents[0].latex)
+        self.assertIn(r"\title{B}", documents[1].latex)
+        self.assertEqual(
+            documents[0].latex.partition(r"\title")[0],
+            documents[1].latex.partition(r"\title")[0]
+        )
+        self.assertIs(self.log.log.handlers, handlers)
+
+    def test_preamble(self) -> None:
+        """Test case for rendering the preamble once per config, and again
+        once the config or the code config changes."""
+
+        with TemporaryDirectory() as tmp, \
+                patch.dict(PREAMBLES, clear=True), \
+                patch(
+                    "src.utils.tex.parser.headings._preamble",
+                    wraps=_preamble
+                ) as render_:
+            with open(f"{tmp}/code_conf.txt", "w", encoding="utf-8") as conf:
+                conf.write(CODE_CONF)
+            config = replace(self.config, code_conf=f"{tmp}/code_conf.txt")
+
+            first: str = preamble(self.log, config)
+            self.assertIs(preamble(self.log, config), first)
+            self.assertIs(
+                preamble(self.log, replace(config, author="Someone")), first
+            )
+            self.assertEqual(render_.call_count, 1)
+
+            self.assertNotEqual(
+                preamble(self.log, replace(config, doc_font="times")), first
+            )
+            self.assertEqual(render_.call_count, 2)
+
+            with open(f"{tmp}/code_conf.txt", "a", encoding="utf-8") as conf:
+                conf.write("\\lstset{numbers=none}\n")
+            utime(f"{tmp}/code_conf.txt", (1e9, 1e9))
+            self.assertIn(
+                "\\lstset{numbers=none}", preamble(self.log, config)
+            )
+            self.assertEqual(render_.call_count, 3)
+
+    def test_parse(self) -> None:
+        """Test case for the blocks of the parsed document."""
+
+        blocks = list(parse(self.rules, ["# A\n", "  \n", "```\n", "x\n"]))
+        self.assertEqual(
+            blocks,
+            [Heading("#", "section", "# A"), Code("```", ["x\n", "\n"], False)]
+        )
+        self.assertEqual(load(dump(blocks)), blocks)
+
+    def test_block_cache(self) -> None:
+        """Test case for the cache of the rendered blocks."""
+
+        lines = ["# A\n", "\n", "Some **text**.\n", "\n", "$$ x $$\n"]
+        outputs = []
+        with TemporaryDirectory() as tmp:
+            for _ in range(2):
+                cache = BlockCache(
+                        self.log,
+                        f"{tmp}/blocks.sqlite",
+                        1024,
+                        self.rules,
+                        self.replacement,
+                        False,
+                        0
+                    )
+                out_file = StringIO()
+                render(
+                    self.rules,
+                    self.replacement,
+                    False,
+                    parse(self.rules, lines),
+                    out_file,
+                    cache
+                )
+                outputs.append(out_file.getvalue())
+                self.assertEqual(len(cache.used), len(outputs) // 2 * 3)
+                cache.close()
+
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertIn(r"\textbf{text}", outputs[0])
+
+    def test_block_cache_batch(self) -> None:
+        """Test case for writing the cached blocks in batches."""
+
+        lines = [f"Line {cur}.\n\n" for cur in range(50)]
+        with TemporaryDirectory() as tmp, \
+                patch("src.mutils.block_cache.BATCH_SIZE", 200):
+            cache = BlockCache(
+                    self.log,
+                    f"{tmp}/blocks.sqlite",
+                    1024*1024,
+                    self.rules,
+                    self.replacement,
+                    False,
+                    0
+                )
+            render(
+                self.rules,
+                self.replacement,
+                False,
+                parse(self.rules, lines),
+                StringIO(),
+                cache
+            )
+            self.assertLess(len(cache.added), 5)
+            assert cache.db is not None
+            written = cache.db.execute("SELECT COUNT(*) FROM blocks")
+            self.assertGreater(written.fetchone()[0], 40)
+            cache.close()
+
+    def test_table(self) -> None:
+        """Test case for the alignment and the longtable of the tables."""
+
+        lines = ["| a | b |\n", "|:---|---:|\n", "| 1 | 2 |\n", "| 3 | 4 |\n"]
+        for long_rows, env in (
+                (0, "tabular"), (2, "tabular"), (1, "longtable")
+            ):
+            out_file = StringIO()
+            render(
+                self.rules,
+                self.replacement,
+                False,
+                parse(self.rules, lines),
+                out_file,
+                long_rows=long_rows
+            )
+            latex = out_file.getvalue()
+            self.assertIn(f"\\begin{{{env}}}{{| l | r |}}", latex)
+            self.assertIn("3 & 4 \\\\", latex)
+
+    def test_format(self) -> None:
+        """Test case for the inline formatting."""
+
+        self.assertEqual(
+            format(
+                self.rules,
+                self.replacement,
+                (
+                    "Some **bold with `some_code`** and __italic__,"
+                    " a [link_text](https://a.b/c_d) and \"quoted\" 100%."
+                ),
+                False
+            ),
+            (
+                "Some \\textbf{bold with \\texttt{some\\_code}} and"
+                " \\textit{italic}, a \\href{https://a.b/c_d}{link\\_text}"
+                " and ``quoted'' 100\\%."
+            )
+        )
+        self.assertEqual(
+            format(
+                self.rules,
+                self.replacement,
+                "Since $a_1 <= b <===> c$ then a_1 <= b, see `a <= b`.",
+                True
+            ),
+            (
+                "Since $a_1 \\leq b \\Longleftrightarrow c$ then a\\_1 <= b,"
+                " see \\texttt{a <= b}."
+            )
+        )
+
+        # only whole tokens are replaced, the valid math is left as is.
+        for math in ("$|x|>0$", "$a<-b$"):
+            self.assertEqual(
+                format(self.rules, self.replacement, math, True), math
+            )
+
+    def test_manifest(self) -> None:
+        """Test case for skipping the unchanged inputs."""
+
+        with TemporaryDirectory() as tmp:
+            source, output = f"{tmp}/a.md", f"{tmp}/a.tex"
+            for path in (source, output):
+                with open(path, "w", encoding="utf-8") as file:
+                    file.write("# A\n")
+
+            manifest = Manifest(self.log, tmp)
+            manifest.record(source, source_hash(source), "conf", output)
+            manifest.save()
+
+            manifest = Manifest(self.log, tmp) # read back from the disk
+            self.assertEqual(
+                manifest.unchanged(source, source_hash(source), "conf"),
+                output
+            )
+            self.assertIsNone(
+                manifest.unchanged(source, source_hash(source), "other")
+            )
+
+            with open(source, "a", encoding="utf-8") as file:
+                file.write("Edited.\n")
+            self.assertIsNone(
+                manifest.unchanged(source, source_hash(source), "conf")
+            )
+
+            remove(output)
+            manifest.record(source, source_hash(source), "conf", output)
+            self.assertIsNone(
+                manifest.unchanged(source, source_hash(source), "conf")
+            )
+
+    def test_config_print(self) -> None:
+        """Test case for the fingerprint of the config of the manifest."""
+
+        args = Namespace(title="T", filename=None, filenametitle=False)
+        with TemporaryDirectory() as tmp:
+            with open(f"{tmp}/code_conf.txt", "w", encoding="utf-8") as conf:
+                conf.write(CODE_CONF)
+            config = replace(self.config, code_conf=f"{tmp}/code_conf.txt")
+            prints = [
+                    _config_print(args, self.rules, conf, self.replacement)
+                    for conf in (
+                        config,
+                        replace(config, profile="draft", max_passes=9),
+                        replace(config, doc_font="times")
+                    )
+                ]
+            self.assertEqual(prints[0], prints[1])
+            self.assertNotEqual(prints[0], prints[2])
+
+            with open(f"{tmp}/code_conf.txt", "a", encoding="utf-8") as conf:
+                conf.write("\\lstset{numbers=none}\n")
+            self.assertNotEqual(
+                _config_print(args, self.rules, config, self.replacement),
+                prints[0]
+            )
+
+    def test_convert_aborted(self) -> None:
+        """Test case for the files left by an aborted conversion."""
+
+        args = Namespace(
+                title="T", filename=None, filenametitle=False, assumeyes=True
+            )
+        with TemporaryDirectory() as tmp:
+            with open(f"{tmp}/b.md", "wb") as source:
+                source.write(b"# B\n\n\xff\xfe\n")
+            config = replace(
+                    self.config, output_folder=f"{tmp}/out", block_cache_size=0
+                )
+
+            with self.assertRaises(SystemExit):
+                convert_file(
+                    self.log,
+                    args,
+                    self.rules,
+                    config,
+                    self.replacement,
+                    f"{tmp}/b.md"
+                )
+            self.assertEqual(listdir(f"{tmp}/out"), [])
+
+    def test_chunk_size(self) -> None:
+        """Test case for the number of files sent to a worker at once."""
+
+        with TemporaryDirectory() as tmp:
+            files: list[str] = []
+            for cur in range(40):
+                files.append(f"{tmp}/{cur}.md")
+                with open(files[-1], "w", encoding="utf-8") as source:
+                    source.write("x"*10)
+
+            self.assertEqual(chunk_size([], 2), 1)
+            self.assertEqual(chunk_size(files, 0), 1)
+            self.assertEqual(chunk_size(files[:8], 2), 1)
+            self.assertEqual(chunk_size(files, 2), 5)
+
+            # a large file does not inflate the chunks of the small ones.
+            with open(files[0], "w", encoding="utf-8") as source:
+                source.write("x"*10000)
+            self.assertEqual(chunk_size(files, 2), 20)
+
+    def test_convert_pool(self) -> None:
+        """Test case for the order of the results of the pool, and for
+        the records and the failures of its workers."""
+
+        args = Namespace(
+                title="T", filename=None, filenametitle=False, assumeyes=True
+            )
+        with TemporaryDirectory() as tmp:
+            files: list[str] = []
+            name: str; content: bytes
+            for name, content in (
+                    ("a", b"Short.\n"),
+                    ("b", b"\xff\xfe\n"), # not UTF-8
+                    ("c", b"Long.\n\n"*200),
+                    ("d", b"Medium.\n\n"*20)
+                ):
+                files.append(f"{tmp}/{name}.md")
+                with open(files[-1], "wb") as source:
+                    source.write(content)
+
+            config = replace(
+                    self.config, output_folder=f"{tmp}/out", block_cache_size=0
+                )
+            records = BufferingHandler(1000)
+            self.log.handlers.append(records)
+            errors: int = len(self.log.errors)
+            try:
+                outputs = convert_pool(
+                        self.log,
+                        args,
+                        self.rules,
+                        config,
+                        self.replacement,
+                        files,
+                        2
+                    )
+            finally:
+                self.log.handlers.remove(records)
+
+            self.assertEqual(
+                outputs,
+                [
+                    f"{tmp}/out/a.tex",
+                    None,
+                    f"{tmp}/out/c.tex",
+                    f"{tmp}/out/d.tex"
+                ]
+            )
+            self.assertIn("can't decode", " ".join(self.log.errors[errors:]))
+
+            # the records of each worker reach the parent in their order.
+            messages: list[str] = [
+                    record.getMessage() for record in records.buffer
+                ]
+            for name in ("a", "c", "d"):
+                self.assertLess(
+                    messages.index(f"Converting {tmp}/{name}.md ..."),
+                    messages.index(
+                        f"Filename is None, using input filename: {name}"
+                        " as filename."
+                    )
+                )
+
+    def test_artifact_store(self) -> None:
+        """Test case for restoring the builds, and evicting the least
+        recently used ones."""
+
+        with TemporaryDirectory() as tmp:
+            store = ArtifactStore(self.log, f"{tmp}/store", 250)
+            self.assertFalse(store.restore("aa1", {".pdf": f"{tmp}/a.pdf"}))
+
+            key: str
+            for key in ("aa1", "bb2", "cc3"):
+                with open(f"{tmp}/{key}.pdf", "w", encoding="utf-8") as pdf:
+                    pdf.write(key*40) # 120 bytes
+                store.store(key, {".pdf": f"{tmp}/{key}.pdf"})
+
+            # aa1 is the oldest, but it is used after bb2.
+            for age, key in ((300, "aa1"), (200, "bb2"), (100, "cc3")):
+                utime(store._entry(key), (1e9-age, 1e9-age))
+            self.assertTrue(store.restore("aa1", {".pdf": f"{tmp}/out.pdf"}))
+            with open(f"{tmp}/out.pdf", "r", encoding="utf-8") as pdf:
+                self.assertEqual(pdf.read(), "aa1"*40)
+
+            store.evict()
+            self.assertEqual(
+                [isdir(store._entry(key)) for key in ("aa1", "bb2", "cc3")],
+                [True, False, True]
+            )
+
+    def _compiler(self, tmp: str) -> str:
+        """Write the fake compiler into the directory.
+
+        Args:
+            tmp -- the directory.
+
+        Returns:
+            The path of the compiler.
+        """
+
+        compiler: str = f"{tmp}/pdflatex"
+        with open(compiler, "w", encoding="utf-8") as script:
+            script.write(FAKE_COMPILER)
+        chmod(compiler, 0o755)
+
+        return compiler
+
+    def test_dump_format(self) -> None:
+        """Test case for dumping the preamble into a format, which is
+        retried once mylatexformat is installed."""
+
+        with TemporaryDirectory() as tmp:
+            ltx: str = f"{tmp}/mylatexformat.ltx"
+            tools: dict[str, str] = {
+                    "kpsewhich": (
+                        f"if os.path.exists({ltx!r}):\n"
+                        f"    print({ltx!r})\n"
+                    ),
+                    "pdflatex": (
+                        "if sys.argv[1] == '--version':\n"
+                        "    sys.exit(print('pdfTeX 3'))\n"
+                        "opts = dict(\n"
+                        "    arg[1:].split('=', 1) for arg in sys.argv[1:]\n"
+                        "    if arg.startswith('-') and '=' in arg\n"
+                        ")\n"
+                        f"if os.path.exists({ltx!r}):\n"
+                        "    open(\n"
+                        "        f\"{opts['output-directory']}/"
+                        "{opts['jobname']}.fmt\", 'w'\n"
+                        "    ).close()\n"
+                    ),
+                }
+            for tool, script in tools.items():
+                with open(f"{tmp}/{tool}", "w", encoding="utf-8") as file:
+                    file.write(f"#!{sys.executable}\nimport os, sys\n{script}")
+                chmod(f"{tmp}/{tool}", 0o755)
+
+            with open(f"{tmp}/a.tex", "w", encoding="utf-8") as tex:
+                tex.write(f"\\documentclass{{article}}\n{ENDOFDUMP}\n")
+            with open(f"{tmp}/b.tex", "w", encoding="utf-8") as tex:
+                tex.write("\\documentclass{article}\n")
+
+            compiler: str = f"{tmp}/pdflatex"
+            with patch.dict(environ, {"PATH": f"{tmp}:{environ['PATH']}"}):
+                version: str = _tex_version(compiler)
+                self.assertIsNone(_format_name(f"{tmp}/b.tex", version))
+                name = _format_name(f"{tmp}/a.tex", version)
+                assert name is not None
+
+                errors: int = len(self.log.errors)
+                for _ in range(2): # reported only once
+                    self.assertIsNone(
+                        _dump_format(
+                            self.log,
+                            compiler,
+                            f"{tmp}/a.tex",
+                            name,
+                            f"{tmp}/formats"
+                        )
+                    )
+                self.assertEqual(len(self.log.errors), errors+1)
+
+                open(ltx, "w", encoding="utf-8").close() # installed
+                installed = _format_name(
+                        f"{tmp}/a.tex", _tex_version(compiler)
+                    )
+                assert installed is not None
+                self.assertNotEqual(installed, name)
+                self.assertEqual(
+                    _dump_format(
+                        self.log,
+                        compiler,
+                        f"{tmp}/a.tex",
+                        installed,
+                        f"{tmp}/formats"
+                    ),
+                    f"{tmp}/formats/{installed}"
+                )
+                self.assertTrue(exists(f"{tmp}/formats/{installed}.fmt"))
+
+    def test_rerun(self) -> None:
+        """Test case for rerunning the compiler until a fixed point, up
+        to the maximum number of passes."""
+
+        with TemporaryDirectory() as tmp:
+            compiler: str = self._compiler(tmp)
+
+            for name, passes, expected in (
+                    ("doc-0", 5, 1), ("doc-2", 5, 3), ("doc-9", 4, 4)
+                ):
+                with open(f"{tmp}/{name}.tex", "w", encoding="utf-8") as tex:
+                    tex.write("\\relax\n")
+                with open(f"{tmp}/{name}.aux", "w", encoding="utf-8") as aux:
+                    aux.write("0")
+
+                self.assertEqual(
+                    _compile(
+                        compiler,
+                        tmp,
+                        f"{tmp}/{name}.tex",
+                        f"{tmp}/{name}.build.log",
+                        passes=passes
+                    ),
+                    0
+                )
+                with open(f"{tmp}/{name}.passes", encoding="utf-8") as count:
+                    self.assertEqual(len(count.read()), expected, name)
+
+    def test_draft(self) -> None:
+        """Test case for the draft profile, whose last pass is always a
+        full one that writes the pdf."""
+
+        with TemporaryDirectory() as tmp:
+            compiler: str = self._compiler(tmp)
+
+            for name, passes, expected in (
+                    ("doc-0", 5, "dx"),
+                    ("doc-2", 5, "dddx"),
+                    ("doc-9", 4, "dddx"),
+                    ("doc-9", 1, "x")
+                ):
+                with open(f"{tmp}/{name}.tex", "w", encoding="utf-8") as tex:
+                    tex.write("\\relax\n")
+                with open(f"{tmp}/{name}.aux", "w", encoding="utf-8") as aux:
+                    aux.write("0")
+                for suffix in (".passes", ".pdf"):
+                    if exists(f"{tmp}/{name}{suffix}"):
+                        remove(f"{tmp}/{name}{suffix}")
+
+                _compile(
+                    compiler,
+                    tmp,
+                    f"{tmp}/{name}.tex",
+                    f"{tmp}/{name}.build.log",
+                    passes=passes,
+                    profile=PROFILES["draft"]
+                )
+                with open(f"{tmp}/{name}.passes", encoding="utf-8") as count:
+                    self.assertEqual(count.read(), expected, name)
+                self.assertTrue(exists(f"{tmp}/{name}.pdf"))
+
+    def test_build_files(self) -> None:
+        """Test case for building in parallel, and restoring the builds
+        that were done before."""
+
+        with TemporaryDirectory() as tmp:
+            compiler: str = self._compiler(tmp)
+            store = ArtifactStore(self.log, f"{tmp}/store", 1 << 20)
+
+            files: list[str] = []
+            name: str
+            for name in ("a-1", "bad", "b-2", "c-1"):
+                files.append(f"{tmp}/{name}.tex")
+                with open(files[-1], "w", encoding="utf-8") as tex:
+                    tex.write(f"\\relax % {name}\n")
+
+            for _ in range(2):
+                builds = build_files(
+                        self.log,
+                        compiler,
+                        tmp,
+                        files,
+                        False,
+                        2,
+                        store,
+                        3,
+                        PROFILES["final"],
+                        f"{tmp}/formats"
+                    )
+                self.assertEqual(
+                    [build.filename for build in builds], files
+                )
+                self.assertEqual(
+                    [build.returncode == 0 for build in builds],
+                    [True, False, True, True]
+                )
+
+            # only the failed build is run again, the others are restored.
+            for name, runs in (("bad", 2), ("b-2", 1)):
+                with open(f"{tmp}/{name}.passes", encoding="utf-8") as count:
+                    self.assertEqual(len(count.read()), runs)
+
+    def test_watcher(self) -> None:
+        """Test case for handling a burst of saves once, after it ends."""
+
+        def save(path: str) -> None:
+            with open(path, "a", encoding="utf-8") as file:
+                file.write("x")
+
+        with TemporaryDirectory() as tmp:
+            watcher = Watcher(self.log, [tmp], 0.05)
+
+            for polling in (False, True):
+                if polling: # as if inotify is not available
+                    watcher.close()
+                    watcher.state = watcher.snapshot()
+
+                timers = [
+                        Timer(delay, save, (f"{tmp}/{delay}.md",))
+                        for delay in (0.1, 0.3, 0.5)
+                    ]
+                for timer in timers:
+                    timer.start()
+
+                start: float = monotonic()
+                watcher.wait(0.4)
+                self.assertGreaterEqual(monotonic()-start, 0.85)
+                for timer in timers:
+                    timer.join()
+
+            watcher.close()
+
+    def test_conf_snapshot(self) -> None:
+        """Test case for loading the snapshot of the config only until
+        simtex.json changes."""
+
+        with TemporaryDirectory() as tmp:
+            conf_file: str = f"{tmp}/simtex.json"
+            with open(conf_file, "w", encoding="utf-8") as conf:
+                conf.write(SIMTEX_JSON)
+
+            snapshot = ConfSnapshot(self.log, conf_file)
+            snapshot.path = f"{tmp}/config.pickle"
+            self.assertIsNone(snapshot.load())
+
+            snapshot.save(
+                snapshot.key(), (self.config, self.rules, self.replacement)
+            )
+            self.assertEqual(
+                snapshot.load(), (self.config, self.rules, self.replacement)
+            )
+
+            with open(conf_file, "a", encoding="utf-8") as conf:
+                conf.write("\n")
+            self.assertIsNone(snapshot.load())
+
+    def test_logger(self) -> None:
+        """Test case for rotating the log file, and the summary of the
+        quiet mode."""
+
+        handlers = self.log.log.handlers # the logger is shared
+        with TemporaryDirectory() as tmp, patch.dict(
+                "os.environ", {"HOME": tmp}
+            ), patch("src.utils.logger.LOG_SIZE", 1024):
+            log = Logger(quiet=True)
+            for cur in range(200):
+                log.logger("I", f"Message {cur:03} of the rotation test.")
+            log.logger("e", "Cannot convert a.md.")
+
+            summary = StringIO()
+            with redirect_stdout(summary):
+                log.summary(2) # the queued records are written first
+
+            printed: str = summary.getvalue()
+            self.assertIn("Cannot convert a.md.", printed)
+            self.assertIn("2 file(s) converted, 1 error(s)", printed)
+
+            with open(f"{tmp}/.simtex/simtex.log", encoding="utf-8") as file:
+                self.assertIn("ERROR Cannot convert a.md.", file.read())
+            self.assertEqual(
+                [
+                    exists(f"{tmp}/.simtex/simtex.log.{backup}")
+                    for backup in range(1, 5)
+                ],
+                [True, True, True, False]
+            )
+
+        self.log.log.handlers = handlers
+
+    def test_server(self) -> None:
+        """Test case for a conversion forwarded to the server, and for an
+        invalid argument, whose error is sent back to the client."""
+
+        cli = Cli()
+        cli._options()
+        cli._doc_args()
+        cli._arguments()
+        cli._misc()
+
+        with TemporaryDirectory() as tmp, \
+                patch("src.utils.server.SOCKET", f"{tmp}/server.sock"), \
+                patch("src.utils.client.SOCKET", f"{tmp}/server.sock"):
+            with open(f"{tmp}/a.md", "w", encoding="utf-8") as source:
+                source.write("# A\n\nSome **text**.\n")
+
+            server = Server(
+                    self.log,
+                    cli.parser,
+                    ConfParse(self.log, True),
+                    (self.config, self.rules, self.replacement)
+                )
+            thread = Thread(target=server.serve_forever)
+            thread.start()
+
+            try:
+                printed = StringIO()
+                with redirect_stdout(printed), redirect_stderr(printed):
+                    returncodes = [
+                            forward([f"{tmp}/a.md", "-y", *argv])
+                            for argv in (
+                                ["-o", f"{tmp}/out", "-q"], ["-t"]
+                            )
+                        ]
+            finally:
+                server.shutdown()
+                server.server_close()
+                thread.join()
+
+            self.assertEqual(returncodes, [0, 1])
+            self.assertTrue(exists(f"{tmp}/out/a.tex"))
+            self.assertIn(
+                "1 file(s) converted, 0 error(s)", printed.getvalue()
+            )
+            self.assertIn("expected one argument", printed.getvalue())
+            self.assertEqual(self.log.errors, [])